@@ -0,0 +1,16 @@
+import os
+import tempfile
+
+# utils.rag_system and the scraper open rag_system.log, scraper.log and
+# server_debug.log in the working directory; run the tests from a scratch
+# directory so they stay out of the checkout
+_log_dir = tempfile.TemporaryDirectory()
+_cwd = os.getcwd()
+
+
+def pytest_configure(config):
+    os.chdir(_log_dir.name)
+
+def pytest_unconfigure(config):
+    os.chdir(_cwd)
+    _log_dir.cleanup()
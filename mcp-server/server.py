@@ -1,10 +1,11 @@
 import logging
 import sys
 import hashlib
+import threading
 from datetime import datetime, timedelta
 
 from fastmcp import FastMCP
-from utils import scrape_partselect_product
+from utils import scrape_partselect_product, warmup
 from utils.rag_system import search_repair_guides, initialize_rag_system
 from utils.simple_search import simple_text_search
 
@@ -87,6 +88,10 @@ def _clean_unicode_data(data):
 
 mcp = FastMCP("PartSelect MCP Server")
 
+# Preconnect the scraper's pooled HTTP/2 client in the background so the first
+# get_part_detail call skips the TCP/TLS handshake (it is closed again at exit)
+threading.Thread(target=warmup, name="scraper-warmup", daemon=True).start()
+
 @mcp.tool()
 def get_part_detail(part_select_number: str) -> dict:
     """
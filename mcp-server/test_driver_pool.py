@@ -0,0 +1,96 @@
+import threading
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from utils.scraper import DriverPool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.quit_called = False
+    
+    def delete_all_cookies(self):
+        pass
+    
+    def get(self, url):
+        pass
+    
+    def quit(self):
+        self.quit_called = True
+
+def _run_threads(target, count):
+    """Run target in count threads; returns the threads still alive after the timeout"""
+    threads = [threading.Thread(target=target, daemon=True) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return [thread for thread in threads if thread.is_alive()]
+
+def test_failed_creation_wakes_waiters():
+    def failing_factory(headless):
+        raise WebDriverException("chrome not available")
+    
+    pool = DriverPool(size=2, factory=failing_factory)
+    errors = []
+    
+    def scrape():
+        try:
+            with pool.checkout():
+                pass
+        except WebDriverException as e:
+            errors.append(e)
+    
+    assert _run_threads(scrape, 3) == []
+    assert len(errors) == 3
+    assert pool._created == 0
+
+def test_discarded_driver_frees_slot_for_waiter():
+    created = []
+    
+    def factory(headless):
+        created.append(FakeDriver())
+        return created[-1]
+    
+    pool = DriverPool(size=1, factory=factory)
+    holding = threading.Event()
+    release = threading.Event()
+    
+    def broken_scrape():
+        with pytest.raises(WebDriverException):
+            with pool.checkout():
+                holding.set()
+                release.wait(5)
+                raise WebDriverException("tab crashed")
+    
+    first = threading.Thread(target=broken_scrape, daemon=True)
+    first.start()
+    holding.wait(5)
+    
+    got = []
+    def waiting_scrape():
+        with pool.checkout() as driver:
+            got.append(driver)
+    
+    second = threading.Thread(target=waiting_scrape, daemon=True)
+    second.start()
+    release.set()
+    first.join(5)
+    second.join(5)
+    
+    assert not second.is_alive()
+    assert created[0].quit_called
+    assert got == [created[1]]
+
+def test_healthy_driver_is_reused():
+    created = []
+    pool = DriverPool(size=2, factory=lambda headless: created.append(FakeDriver()) or created[-1])
+    
+    for _ in range(3):
+        with pool.checkout() as driver:
+            assert driver is created[0]
+    
+    assert len(created) == 1
+    pool.close()
+    assert created[0].quit_called
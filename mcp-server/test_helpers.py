@@ -0,0 +1,94 @@
+import re
+import time
+from pathlib import Path
+
+import pytest
+
+from utils import scraper
+from utils.helpers import TTLCache, appliance_type_for_path, compile_patterns, extract_first_match, extract_with_patterns
+
+
+PRICE_PAGE = b'<span>Price: $10.50</span> <span class="was">$20.00</span> 45.99 USD'
+RATING_PAGE = b'<div>4.5 / 5.0</div> <div>3.0 / 5.0</div> 12 Reviews, later 30 Reviews'
+REPLACES_PAGE = (
+    b'Part# PS11752778 replaces these: AP1, AP2\n'
+    b'<div class="bold mb-1">Part# PS11752778 replaces these:</div>\n<div class="col">AP6019471, 2171046</div>'
+)
+
+@pytest.mark.parametrize("patterns, page", [
+    (scraper._PRICE_RE, PRICE_PAGE),
+    (scraper._RATING_RE, RATING_PAGE),
+    (scraper._REVIEW_RE, RATING_PAGE),
+    (scraper._REPLACES_RE, REPLACES_PAGE),
+    (scraper._REPLACES_RE, b'Part# PS11752778 replaces these: AP1, AP2\n'),
+    (scraper._PRICE_RE, b'no price here'),
+])
+def test_extract_first_match_matches_sequential_search(patterns, page):
+    assert extract_first_match(page, patterns) == extract_with_patterns(page, [p.pattern for p in patterns])
+
+def test_higher_priority_pattern_wins_over_earlier_text():
+    # "Price: $10.50" also matches the lower-priority Price[:\s]*\$ pattern; the
+    # generic dollar pattern is listed first and must still return 10.50
+    assert extract_first_match(PRICE_PAGE, scraper._PRICE_RE) == b'10.50'
+    assert scraper._extract_pricing(PRICE_PAGE) == {'price': 10.5}
+
+def test_first_rating_and_review_count():
+    assert scraper._extract_review_info(RATING_PAGE) == {'rating': 4.5, 'review_count': 12}
+
+def test_replaces_prefers_structured_block():
+    assert extract_first_match(REPLACES_PAGE, scraper._REPLACES_RE) == b'AP6019471, 2171046'
+
+def test_compile_patterns_wraps_literal_patterns():
+    patterns = compile_patterns((r'Refrigerator\.', r'model: (\w+)'))
+    assert extract_first_match("Fits any Refrigerator. model: ABC", patterns) == "Refrigerator."
+    assert extract_first_match("model: ABC", patterns) == "ABC"
+
+def test_compile_patterns_rejects_multiple_groups():
+    with pytest.raises(ValueError):
+        compile_patterns((r'(a)(b)',))
+
+def test_compile_patterns_is_case_insensitive():
+    assert compile_patterns((b'in (stock)',))[0].flags & re.IGNORECASE
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    now[0] += 61
+    assert cache.get("a") is None
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+
+def test_ttl_cache_caps_total_bytes():
+    cache = TTLCache(maxsize=10, ttl=60, maxbytes=10)
+    cache.set("a", b"1234")
+    cache.set("b", b"5678")
+    cache.set("a", b"12")
+    cache.set("c", b"abcdef")
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert cache.pop("a") == b"12"
+    cache.set("d", b"1234")
+    assert "c" in cache and "d" in cache
+
+@pytest.mark.parametrize("path, appliance_type", [
+    ("data/refrigerator/refrigerator_leaking_detail.json", "Refrigerator"),
+    ("data/refrigerator_extra/leaking_detail.json", "Refrigerator"),
+    ("data/dishwasher/dishwasher_noisy_detail.json", "Dishwasher"),
+    ("data/misc/washer_leaking_detail.json", "Washer"),
+    ("data/misc/scraped_parts.json", "General"),
+])
+def test_appliance_type_for_path(path, appliance_type):
+    assert appliance_type_for_path(Path(path), Path("data")) == appliance_type
+
+def test_appliance_type_ignores_directories_above_data_dir():
+    assert appliance_type_for_path(Path("/srv/dryer/data/misc/noisy.json"), Path("/srv/dryer/data")) == "General"
@@ -0,0 +1,73 @@
+import pytest
+
+from utils import scraper
+
+
+URL = "https://www.partselect.com/PS11752778-1.htm"
+
+
+@pytest.fixture
+def scrape(monkeypatch):
+    """Scrape a product with a canned page and a stubbed model compatibility result"""
+    async def fake_fetch_html(url):
+        return b"<html><h1 class=\"title-lg\">Door Shelf Bin</h1></html>"
+    
+    monkeypatch.setattr(scraper, "_fetch_html", fake_fetch_html)
+    monkeypatch.setattr(scraper, "_disk_cache", None)
+    scraper._PAGE_CACHE.clear()
+    scraper._RESULT_CACHE.clear()
+    
+    def run(model_compatibility):
+        monkeypatch.setattr(scraper, "_scrape_model_compatibility", lambda url, headless=True, page_text=None: model_compatibility)
+        return scraper.scrape_partselect_product("PS11752778")
+    
+    yield run
+    scraper._PAGE_CACHE.clear()
+    scraper._RESULT_CACHE.clear()
+
+def test_failed_compatibility_scrape_is_not_cached(scrape):
+    result = scrape(None)
+    assert result["model_compatibility"] == []
+    assert len(scraper._RESULT_CACHE) == 0
+
+def test_no_compatible_models_is_cached(scrape):
+    scrape([])
+    assert len(scraper._RESULT_CACHE) == 1
+
+def test_failed_compatibility_scrape_is_retried(scrape):
+    scrape(None)
+    models = [{"brand": "Whirlpool", "model_number": "WRS325FDAM04", "description": "Refrigerator"}]
+    assert scrape(models)["model_compatibility"] == models
+
+def test_cached_result_replaces_page_html(scrape):
+    scrape([])
+    assert URL not in scraper._PAGE_CACHE
+
+def test_page_html_kept_for_retry_after_failed_compatibility_scrape(scrape):
+    scrape(None)
+    assert URL in scraper._PAGE_CACHE
+
+class FakeDriver:
+    def get(self, url):
+        pass
+    
+    def delete_all_cookies(self):
+        pass
+    
+    def quit(self):
+        pass
+
+@pytest.fixture
+def timed_out_compatibility(monkeypatch):
+    """Run _scrape_model_compatibility with Chrome never showing the section"""
+    pool = scraper.DriverPool(size=1, factory=lambda headless: FakeDriver())
+    monkeypatch.setattr(scraper, "get_driver_pool", lambda headless=True: pool)
+    monkeypatch.setattr(scraper, "wait_for_element", lambda driver, selector, timeout=10: False)
+    return lambda page_text: scraper._scrape_model_compatibility(URL, page_text=page_text)
+
+def test_compatibility_timeout_is_a_failure(timed_out_compatibility):
+    assert timed_out_compatibility(b'<div id="ModelCrossReference">Model Cross Reference</div>') is None
+    assert timed_out_compatibility(None) is None
+
+def test_page_without_compatibility_section_has_no_models(timed_out_compatibility):
+    assert timed_out_compatibility(b"<html><h1>Door Shelf Bin</h1></html>") == []
@@ -0,0 +1,64 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from utils import rag_system
+from utils.rag_system import RepairRAGSystem, _replace_file
+
+faiss = pytest.importorskip("faiss")
+
+
+@pytest.fixture
+def rag(tmp_path, monkeypatch):
+    """A RepairRAGSystem whose .rag_index lives under tmp_path"""
+    # The loader only needs faiss, which is present even when the embedding
+    # dependencies (torch, sentence-transformers) are not
+    monkeypatch.setattr(rag_system, "faiss", faiss)
+    monkeypatch.setattr(rag_system, "RAG_AVAILABLE", True)
+    monkeypatch.chdir(tmp_path)
+    return RepairRAGSystem(data_dir=str(tmp_path / "data"))
+
+def _save_index(rag: RepairRAGSystem, vectors: np.ndarray):
+    """Write vectors the way build_index does: an inner-product HNSW graph plus metadata"""
+    index = faiss.IndexHNSWFlat(vectors.shape[1], rag_system.HNSW_M, faiss.METRIC_INNER_PRODUCT)
+    index.add(vectors)
+    _replace_file(rag.index_file, lambda path: faiss.write_index(index, str(path)))
+    sections = [{"appliance_type": "Refrigerator"} for _ in range(len(vectors))]
+    _replace_file(rag.meta_file, lambda path: path.write_text(json.dumps({"sections": sections})))
+
+def _unit_vectors(count: int, seed: int) -> np.ndarray:
+    vectors = np.random.default_rng(seed).standard_normal((count, 8)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+def test_rebuild_leaves_mapped_index_intact(rag):
+    old_vectors = _unit_vectors(16, seed=0)
+    _save_index(rag, old_vectors)
+    rag._load_existing_index()
+    mapped = rag._index
+    
+    _save_index(rag, _unit_vectors(4, seed=1))
+    
+    # The reader still sees the index it mapped; a fresh load sees the rebuild
+    assert mapped.ntotal == 16
+    assert np.allclose(mapped.reconstruct_n(0, 16), old_vectors)
+    _, ids = mapped.search(old_vectors[:1], 1)
+    assert ids[0][0] == 0
+    
+    rag._load_existing_index()
+    assert rag._index.ntotal == 4
+    assert sorted(path.name for path in rag.index_dir.iterdir()) == [rag.index_file.name, rag.meta_file.name]
+
+def test_failed_write_keeps_previous_file(tmp_path):
+    meta_file = tmp_path / "metadata.json"
+    meta_file.write_text("old")
+    
+    def failing_write(path: Path):
+        path.write_text("partial")
+        raise OSError("disk full")
+    
+    with pytest.raises(OSError):
+        _replace_file(meta_file, failing_write)
+    assert meta_file.read_text() == "old"
+    assert list(tmp_path.iterdir()) == [meta_file]
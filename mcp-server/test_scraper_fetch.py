@@ -0,0 +1,46 @@
+import httpx
+import pytest
+
+from utils import scraper
+
+
+@pytest.fixture
+def fetch(monkeypatch):
+    """Run _fetch_page against a canned HTTP status, recording Chrome fallbacks"""
+    browser_calls = []
+    monkeypatch.setattr(scraper, "_disk_cache", None)
+    monkeypatch.setattr(scraper, "_fetch_html_with_browser", lambda url, headless=True: browser_calls.append(url) or b"<html>chrome</html>")
+    scraper._PAGE_CACHE.clear()
+    
+    def run(status_code):
+        transport = httpx.MockTransport(lambda request: httpx.Response(status_code, content=b"<html></html>"))
+        monkeypatch.setattr(scraper, "_http_client", httpx.AsyncClient(transport=transport))
+        return scraper._run(scraper._fetch_page(f"https://www.partselect.com/{status_code}.htm")), browser_calls
+    
+    yield run
+    scraper._PAGE_CACHE.clear()
+
+@pytest.mark.parametrize("status_code", [404, 410])
+def test_missing_page_skips_chrome(fetch, status_code):
+    page_text, browser_calls = fetch(status_code)
+    assert page_text is None
+    assert browser_calls == []
+
+@pytest.mark.parametrize("status_code", [403, 429, 500])
+def test_blocked_page_falls_back_to_chrome(fetch, status_code):
+    page_text, browser_calls = fetch(status_code)
+    assert page_text == b"<html>chrome</html>"
+    assert len(browser_calls) == 1
+
+def test_warmup_preconnects_and_shutdown_closes_client(monkeypatch):
+    requests = []
+    transport = httpx.MockTransport(lambda request: requests.append(request) or httpx.Response(200))
+    client = httpx.AsyncClient(transport=transport)
+    monkeypatch.setattr(scraper, "_http_client", client)
+    
+    assert scraper.warmup()
+    assert [(r.method, str(r.url)) for r in requests] == [("HEAD", f"{scraper.PARTSELECT_BASE_URL}/")]
+    
+    scraper._close_http_client()
+    assert client.is_closed
+    assert scraper._http_client is None
@@ -0,0 +1,131 @@
+import json
+
+import numpy as np
+import pytest
+
+from utils import simple_search
+
+
+REPAIRS = {
+    "dishwasher/dishwasher_noisy_detail.json": {
+        "symptom_title": "Noisy",
+        "url": "https://www.partselect.com/Repair/Dishwasher/Noisy/",
+        "repair_sections": [
+            {
+                "title": "Pump",
+                "description": "A worn pump makes a grinding noise during the wash cycle.",
+                "instructions": ["Remove the lower rack.", "Check the pump impeller for debris."],
+                "related_parts": [{"name": "Circulation Pump", "url": "https://www.partselect.com/PS1.htm"}],
+            },
+            {
+                "title": "Spray Arm",
+                "description": "A loose spray arm can hit the rack and rattle.",
+                "instructions": ["Tighten the spray arm.", "Listen for the pump while it runs."],
+                "related_parts": [],
+            },
+        ],
+    },
+    "refrigerator/refrigerator_leaking_detail.json": {
+        "symptom_title": "Leaking",
+        "url": "https://www.partselect.com/Repair/Refrigerator/Leaking/",
+        "repair_sections": [
+            {
+                "title": "Water Inlet Valve",
+                "description": "A cracked water inlet valve leaks water under the refrigerator.",
+                "instructions": ["Shut off the water supply.", "Replace the water inlet valve."],
+                "related_parts": [{"name": "Water Inlet Valve", "url": "https://www.partselect.com/PS2.htm"}],
+            },
+        ],
+    },
+}
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """A small repair-data tree, with indexes cached under tmp_path"""
+    for name, repair in REPAIRS.items():
+        path = tmp_path / "data" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(repair))
+    
+    monkeypatch.setattr(simple_search, "INDEX_DIR", tmp_path / ".search_index")
+    simple_search._indexes.clear()
+    simple_search._search_impl.cache_clear()
+    yield tmp_path / "data"
+    simple_search._indexes.clear()
+    simple_search._search_impl.cache_clear()
+
+def test_cached_results_are_isolated_from_callers(data_dir):
+    first = simple_search.simple_text_search(str(data_dir), "pump grinding")
+    first["results"][0]["instructions"].append("edited")
+    first["results"][0]["related_parts"].clear()
+    
+    second = simple_search.simple_text_search(str(data_dir), "pump grinding")
+    assert "edited" not in second["results"][0]["instructions"]
+    assert second["results"][0]["related_parts"] == [{"name": "Circulation Pump", "url": "https://www.partselect.com/PS1.htm"}]
+
+def test_sharded_build_matches_single_process_build(data_dir, monkeypatch):
+    serial = simple_search.build_index(str(data_dir))
+    
+    monkeypatch.setattr(simple_search, "PARALLEL_INDEX_MIN_FILES", 1)
+    monkeypatch.setattr(simple_search.os, "cpu_count", lambda: 2)
+    sharded = simple_search.build_index(str(data_dir))
+    
+    assert sharded.sections == serial.sections
+    assert sharded.vocab == serial.vocab
+    for name in simple_search.SearchIndex.ARRAYS:
+        np.testing.assert_array_equal(getattr(sharded, name), getattr(serial, name))
+
+def test_saved_index_loads_with_the_same_scores(data_dir, tmp_path):
+    built = simple_search.build_index(str(data_dir))
+    built.save(tmp_path / "index")
+    loaded = simple_search.SearchIndex.load(tmp_path / "index", built.signature)
+    
+    assert loaded.sections == built.sections
+    saved = {path.name for path in (tmp_path / "index").iterdir()}
+    assert saved == {f"{name}.npy" for name in simple_search.SearchIndex.ARRAYS} | {"vocab.json", "sections.json", "meta.json"}
+    assert isinstance(loaded.postings_docs, np.memmap)
+    query = simple_search._normalize_query("pump leaking water")
+    np.testing.assert_array_equal(simple_search._bm25f_scores(loaded, query), simple_search._bm25f_scores(built, query))
+
+def test_saved_index_with_another_signature_is_not_loaded(data_dir, tmp_path):
+    built = simple_search.build_index(str(data_dir))
+    built.save(tmp_path / "index")
+    assert simple_search.SearchIndex.load(tmp_path / "index", "stale") is None
+
+def test_bm25f_ranks_title_matches_first(data_dir):
+    results = simple_search.simple_text_search(str(data_dir), "pump")["results"]
+    # "pump" is the Pump section's title; Spray Arm only mentions it in an instruction
+    assert [r["issue_title"] for r in results] == ["Pump", "Spray Arm"]
+    assert results[0]["score"] > results[1]["score"]
+
+def test_appliance_filter(data_dir):
+    assert simple_search.simple_text_search(str(data_dir), "water valve", "Dishwasher")["results"] == []
+    results = simple_search.simple_text_search(str(data_dir), "water valve", "Refrigerator")["results"]
+    assert [r["issue_title"] for r in results] == ["Water Inlet Valve"]
+
+def test_rebuild_leaves_mapped_index_intact(data_dir, tmp_path):
+    key = str(data_dir.resolve())
+    simple_search._load_or_build_index(data_dir, key)
+    mapped = simple_search._load_or_build_index(data_dir, key)
+    assert isinstance(mapped.postings_docs, np.memmap)
+    old_postings = np.array(mapped.postings_docs)
+    
+    # Change the corpus so the next load rebuilds and saves a new index
+    (data_dir / "dishwasher" / "dishwasher_noisy_detail.json").unlink()
+    rebuilt = simple_search._load_or_build_index(data_dir, key)
+    
+    np.testing.assert_array_equal(mapped.postings_docs, old_postings)
+    assert rebuilt.num_docs == 1
+    builds = [path for root in (tmp_path / ".search_index").iterdir() for path in root.iterdir()]
+    assert [path.name for path in builds] == [f"v{simple_search.INDEX_VERSION}-{rebuilt.signature[:16]}"]
+    assert simple_search._load_or_build_index(data_dir, key).num_docs == 1
+
+def test_compiled_bm25f_kernel_matches_numpy(data_dir, monkeypatch):
+    if simple_search._bm25f_accumulate is None:
+        pytest.skip("numba is not installed")
+    index = simple_search.build_index(str(data_dir))
+    query = simple_search._normalize_query("pump leaking water arm")
+    compiled = simple_search._bm25f_scores(index, query)
+    
+    monkeypatch.setattr(simple_search, "_bm25f_accumulate", None)
+    np.testing.assert_allclose(compiled, simple_search._bm25f_scores(index, query), rtol=1e-6)
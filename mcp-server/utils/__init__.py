@@ -1,6 +1,6 @@
 # Utils package for scraping functions
 
-from .scraper import scrape_partselect_product, scrape_partselect_repairs, scrape_symptom_detail
+from .scraper import scrape_partselect_product, scrape_partselect_repairs, scrape_symptom_detail, scrape_many, warmup
 from .helpers import setup_logging
 
-__all__ = ['scrape_partselect_product', 'scrape_partselect_repairs', 'scrape_symptom_detail', 'setup_logging']
+__all__ = ['scrape_partselect_product', 'scrape_partselect_repairs', 'scrape_symptom_detail', 'scrape_many', 'warmup', 'setup_logging']
@@ -9,10 +9,27 @@ CHROME_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit
 
 # Timeouts and delays
 DEFAULT_TIMEOUT = 10
+PAGE_LOAD_TIMEOUT = 15  # Chrome navigation (eager strategy - returns at DOMContentLoaded)
+SCRIPT_TIMEOUT = 10  # Chrome execute_script / async scripts
+BROWSER_WAIT_TIMEOUT = 10  # WebDriverWait for a page's ready element
+
+# Shared httpx connection pool (keep-alive + HTTP/2) used by every scrape
+HTTP_MAX_CONNECTIONS = 64
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 32
 MIN_DELAY = 2
 MAX_DELAY = 4
 MIN_CONTENT_LENGTH = 1000
 
+# Maximum number of warm Chrome drivers kept by the scraper's DriverPool
+DRIVER_POOL_SIZE = 2
+
+# Scrape caching - raw HTML keyed by URL, parsed results by (URL, schema version).
+# Bump SCRAPE_SCHEMA_VERSION whenever the extraction patterns change.
+PAGE_CACHE_SIZE = 4096
+PAGE_CACHE_TTL = 3600  # seconds
+PAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024  # raw HTML pages are ~200-400 KB each
+SCRAPE_SCHEMA_VERSION = 1
+
 # CSS Selectors
 PRODUCT_NAME_SELECTORS = [
     'h1.product-name',
@@ -1,11 +1,9 @@
 import re
 import time
 import random
-from typing import List, Dict, Any, Optional
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Pattern, Tuple, Union
 import logging
 
 from pathlib import Path
@@ -29,14 +27,47 @@ def random_delay(min_seconds: int = 2, max_seconds: int = 4):
     delay = random.uniform(min_seconds, max_seconds)
     time.sleep(delay)
 
-def extract_with_patterns(text: str, patterns: List[str], group: int = 1) -> Optional[str]:
-    """Extract text using multiple regex patterns"""
+def extract_with_patterns(text: str, patterns: List[Union[str, bytes, Pattern]], group: int = 1) -> Optional[str]:
+    """Extract text using multiple regex patterns (strings or precompiled re.Pattern objects)"""
     for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+        if isinstance(pattern, (str, bytes)):
+            match = re.search(pattern, text, re.IGNORECASE)
+        else:
+            match = pattern.search(text)  # Precompiled patterns carry their own flags
         if match:
             return match.group(group).strip()
     return None
 
+def compile_patterns(patterns: List[Union[str, bytes]], flags: int = re.IGNORECASE) -> Tuple[Pattern, ...]:
+    """
+    Precompile a priority-ordered pattern list for extract_first_match. Each pattern
+    captures its value in group 1; one with no group captures the whole match.
+    """
+    compiled = []
+    for pattern in patterns:
+        # Build the wrapper in the pattern's own type so bytes patterns stay bytes
+        open_group, close = ('(', ')') if isinstance(pattern, str) else (b'(', b')')
+        group_count = re.compile(pattern).groups
+        if group_count == 0:
+            pattern = open_group + pattern + close  # Literal "direct match" patterns capture the whole match
+        elif group_count > 1:
+            raise ValueError(f"Extraction patterns may capture at most one group: {pattern!r}")
+        compiled.append(re.compile(pattern, flags))
+    return tuple(compiled)
+
+def extract_first_match(text: Union[str, bytes], patterns: Tuple[Pattern, ...]) -> Optional[Union[str, bytes]]:
+    """
+    Precompiled equivalent of extract_with_patterns: the first match of the
+    earliest-listed pattern that matches anywhere. Each pattern is searched on its
+    own - a single merged alternation can't be used, since a lower-priority match
+    earlier in the text would consume text a higher-priority one needs.
+    """
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            return match.group(1).strip()
+    return None
+
 def extract_all_with_pattern(text: str, pattern: str, group: int = 1) -> List[str]:
     """Extract all matches for a pattern"""
     matches = re.findall(pattern, text, re.IGNORECASE)
@@ -44,6 +75,8 @@ def extract_all_with_pattern(text: str, pattern: str, group: int = 1) -> List[st
 
 def safe_find_element(driver, selectors: List[str], timeout: int = 3) -> Optional[str]:
     """Safely find element using multiple selectors"""
+    from selenium.webdriver.common.by import By
+    
     for selector in selectors:
         try:
             # Use a shorter timeout and direct find instead of WebDriverWait
@@ -56,6 +89,8 @@ def safe_find_element(driver, selectors: List[str], timeout: int = 3) -> Optiona
 
 def safe_find_elements(driver, selector: str) -> List:
     """Safely find multiple elements"""
+    from selenium.webdriver.common.by import By
+    
     try:
         return driver.find_elements(By.CSS_SELECTOR, selector)
     except Exception as e:
@@ -99,6 +134,117 @@ def validate_page_load(driver, min_content_length: int = 1000) -> bool:
     
     return True
 
+def wait_for_element(driver, selector: str, timeout: int = 10) -> bool:
+    """Wait until an element matching the CSS selector is present; False on timeout"""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import TimeoutException
+    
+    try:
+        WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+        return True
+    except TimeoutException:
+        logging.warning(f"Timed out after {timeout}s waiting for '{selector}'")
+        return False
+
+def validate_page_html(page_text: Union[str, bytes], min_content_length: int = 1000) -> bool:
+    """Validate raw HTML fetched without a browser (same checks as validate_page_load)"""
+    title_pattern = r'<title[^>]*>([^<]*)</title>' if isinstance(page_text, str) else rb'<title[^>]*>([^<]*)</title>'
+    title_match = re.search(title_pattern, page_text, re.IGNORECASE)
+    title = title_match.group(1).strip().lower() if title_match else ''
+    if isinstance(title, bytes):
+        title = title.decode('utf-8', 'replace')
+    
+    # Check for access denied or error pages
+    if any(error in title for error in ['access denied', '403', 'error', 'not found']):
+        logging.error(f"Page access denied or error: {title}")
+        return False
+    
+    # Check content length
+    if len(page_text) < min_content_length:
+        logging.error(f"Page content too short: {len(page_text)} chars")
+        return False
+    
+    return True
+
+# Path keyword -> appliance type, checked in order so "dishwasher" wins over "washer"
+APPLIANCE_ROUTES = (
+    ("refrigerator", "Refrigerator"),
+    ("dishwasher", "Dishwasher"),
+    ("washer", "Washer"),
+    ("dryer", "Dryer"),
+)
+
+def appliance_type_for_path(path: Path, data_dir: Path) -> str:
+    """Appliance type named anywhere in path below data_dir, else "General" """
+    try:
+        path = path.relative_to(data_dir)
+    except ValueError:
+        pass
+    path_lc = path.as_posix().lower()
+    return next((name for key, name in APPLIANCE_ROUTES if key in path_lc), "General")
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire ttl seconds after being stored.
+    With maxbytes set, values must support len() and their total length is capped too.
+    """
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600, maxbytes: Optional[int] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.maxbytes = maxbytes
+        self._data = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+    
+    def _remove(self, key):
+        _, value = self._data.pop(key)
+        if self.maxbytes is not None:
+            self._bytes -= len(value)
+    
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                self._remove(key)
+                return default
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key, value):
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            if self.maxbytes is not None:
+                self._bytes += len(value)
+            while len(self._data) > self.maxsize or (self.maxbytes is not None and self._bytes > self.maxbytes):
+                self._remove(next(iter(self._data)))
+    
+    def pop(self, key, default=None):
+        with self._lock:
+            if key not in self._data:
+                return default
+            value = self._data[key][1]
+            self._remove(key)
+            return value
+    
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+    
+    def __contains__(self, key) -> bool:
+        return self.get(key) is not None
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
 def setup_anti_detection(driver):
     """Apply enhanced anti-detection measures to the driver"""
     try:
@@ -163,6 +309,9 @@ def simulate_human_behavior(driver):
 
 def extract_youtube_videos(driver, page_source: str) -> List[Dict[str, str]]:
     """Extract YouTube installation videos"""
+    from selenium.webdriver.common.by import By
+    from selenium.common.exceptions import NoSuchElementException
+    
     videos = []
     
     try:
@@ -219,8 +368,49 @@ def extract_youtube_videos(driver, page_source: str) -> List[Dict[str, str]]:
     
     return videos
 
+def extract_youtube_videos_from_html(page_source: Union[str, bytes]) -> List[Dict[str, str]]:
+    """Extract YouTube installation videos from raw HTML (no browser needed)"""
+    videos = []
+    seen = set()
+    if isinstance(page_source, str):
+        page_source = page_source.encode('utf-8')
+    
+    # Video containers carry the id in data-yt-init; the thumbnail <img> holds the title.
+    # Scan the raw bytes and decode only the captured pieces.
+    container_pattern = rb'<div[^>]*data-yt-init="([a-zA-Z0-9_-]+)"[^>]*data-iframe-id="[^"]*"[^>]*>\s*<img([^>]*)>'
+    for video_id, img_attrs in re.findall(container_pattern, page_source):
+        video_id = video_id.decode('ascii')
+        if video_id in seen:
+            continue
+        seen.add(video_id)
+        
+        title_match = (re.search(rb'title="([^"]+)"', img_attrs) or
+                       re.search(rb'alt="([^"]+)"', img_attrs))
+        title = title_match.group(1).strip().decode('utf-8', 'replace') if title_match else "Installation Video"
+        
+        videos.append({
+            'title': title,
+            'url': f"https://www.youtube.com/watch?v={video_id}",
+            'video_id': video_id
+        })
+    
+    # Fallback - thumbnail URLs anywhere in the page
+    if not videos:
+        youtube_matches = re.findall(rb'https://img\.youtube\.com/vi/([a-zA-Z0-9_-]+)/[^"\']*', page_source)
+        for video_id in youtube_matches[:5]:  # Limit to first 5
+            video_id = video_id.decode('ascii')
+            videos.append({
+                'title': 'Installation Video',
+                'url': f"https://www.youtube.com/watch?v={video_id}",
+                'video_id': video_id
+            })
+    
+    return videos
+
 def extract_model_compatibility(driver) -> List[Dict[str, str]]:
     """Extract compatible models by clicking Model Cross Reference section"""
+    from selenium.webdriver.common.by import By
+    
     models = []
     
     try:
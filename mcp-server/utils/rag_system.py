@@ -5,35 +5,91 @@ Uses FAISS for vector search and SentenceTransformers for embeddings.
 
 import json
 import hashlib
+import os
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 import logging
 import sys
+import atexit
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+from .helpers import appliance_type_for_path
+
+# Set up logging - NO STDOUT to avoid MCP protocol corruption.
+# The file handlers run on a QueueListener thread so search never blocks on disk writes.
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(
+    _log_queue,
+    logging.FileHandler('rag_system.log'),
+    logging.FileHandler('server_debug.log')  # Also log to server debug
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
-# Set up logging - NO STDOUT to avoid MCP protocol corruption
 logging.basicConfig(
     level=logging.DEBUG,  # More verbose logging
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('rag_system.log'),
-        logging.FileHandler('server_debug.log')  # Also log to server debug
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
 
+# Pin BLAS/OpenMP thread pools so several server workers don't oversubscribe the
+# cores. The env vars must be set before torch/faiss are first imported.
+_CPU_COUNT = os.cpu_count() or 1
+RAG_THREADS = int(os.environ.get("RAG_THREADS", max(1, _CPU_COUNT // 2)))
+RAG_FAISS_THREADS = int(os.environ.get("RAG_FAISS_THREADS", max(1, _CPU_COUNT // 4)))
+os.environ.setdefault("OMP_NUM_THREADS", str(RAG_THREADS))
+os.environ.setdefault("MKL_NUM_THREADS", str(RAG_THREADS))
+
 try:
     import faiss
+    import torch
     from sentence_transformers import SentenceTransformer
+    torch.set_num_threads(RAG_THREADS)
+    faiss.omp_set_num_threads(RAG_FAISS_THREADS)
     RAG_AVAILABLE = True
     print("RAG dependencies imported successfully")
 except ImportError as e:
     RAG_AVAILABLE = False
     faiss = None
+    torch = None
     SentenceTransformer = None
     print(f"RAG dependencies import failed: {e}")
     print("Install with: pip install faiss-cpu sentence-transformers")
 
+# BLAKE3 (SIMD) when installed, else hashlib's SHA-256 (SHA-NI accelerated on modern CPUs)
+try:
+    from blake3 import blake3 as _fast_hash
+except ImportError:
+    _fast_hash = hashlib.sha256
+
 logger = logging.getLogger(__name__)
 
+# Number of sections embedded and added to FAISS per step in build_index
+EMBED_CHUNK_SIZE = 4096
+
+# SentenceTransformer encode batch size (small enough to stay CPU-cache friendly)
+ENCODE_BATCH_SIZE = 64
+
+# HNSW graph parameters: neighbours per node, build-time and query-time beam width
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 80
+HNSW_EF_SEARCH = 64
+
+def _replace_file(path: Path, write: Callable[[Path], None]):
+    """
+    Write a file via a temp file renamed over path. Processes that have the old
+    file memory-mapped keep reading its (now unlinked) inode instead of seeing it
+    rewritten under them, and nobody ever opens a half-written file.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 class RepairRAGSystem:
     def __init__(self, data_dir: str = "data", model_name: str = "intfloat/e5-small-v2"):
         print(f"Initializing RepairRAGSystem")
@@ -73,8 +129,9 @@ class RepairRAGSystem:
             logger.info(f"🤖 Loading SentenceTransformer model: {self.model_name}")
             logger.info("   This may take a while on first run (downloading model)...")
             try:
-                self._model = SentenceTransformer(self.model_name)
-                logger.info(f"✅ Model loaded successfully: {self.model_name}")
+                device = "cuda" if torch.cuda.is_available() else "cpu"
+                self._model = SentenceTransformer(self.model_name, device=device)
+                logger.info(f"✅ Model loaded successfully: {self.model_name} (device: {device})")
             except Exception as e:
                 logger.error(f"❌ Failed to load model {self.model_name}: {e}")
                 raise
@@ -113,7 +170,7 @@ class RepairRAGSystem:
     
     def _calculate_data_hash(self) -> str:
         """Calculate hash of all data files to detect changes"""
-        hash_md5 = hashlib.md5()
+        hasher = _fast_hash()
         
         # Get all JSON files in data directory
         json_files = sorted(self.data_dir.rglob("*.json"))
@@ -121,49 +178,53 @@ class RepairRAGSystem:
         for json_file in json_files:
             try:
                 # Add file path and modification time to hash
-                hash_md5.update(str(json_file).encode('utf-8'))
-                hash_md5.update(str(json_file.stat().st_mtime).encode('utf-8'))
+                hasher.update(str(json_file).encode('utf-8'))
+                hasher.update(str(json_file.stat().st_mtime).encode('utf-8'))
                 
                 # Add file content to hash
                 with open(json_file, 'rb') as f:
                     for chunk in iter(lambda: f.read(4096), b""):
-                        hash_md5.update(chunk)
+                        hasher.update(chunk)
             except Exception as e:
                 logger.warning(f"⚠️ Error hashing {json_file}: {e}")
         
-        return hash_md5.hexdigest()
+        return hasher.hexdigest()
     
     def _embed_texts(self, texts: List[str]) -> Any:
         """Generate embeddings for texts"""
         model = self._load_model()
         # For e5 models, prefix with "passage: " for documents, "query: " for queries
         passages = [f"passage: {text}" for text in texts]
-        return model.encode(passages, normalize_embeddings=True)
+        return model.encode(
+            passages,
+            batch_size=ENCODE_BATCH_SIZE,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )
     
     def _embed_query(self, query: str) -> Any:
         """Generate embedding for a query"""
         model = self._load_model()
-        return model.encode([f"query: {query}"], normalize_embeddings=True)[0]
+        return model.encode(
+            [f"query: {query}"],
+            batch_size=1,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )[0]
     
     def _hash_text(self, text: str) -> str:
         """Generate a hash for text deduplication"""
-        return hashlib.sha256(text.encode()).hexdigest()[:12]
+        return _fast_hash(text.encode()).hexdigest()[:12]
     
     def _extract_repair_sections(self, json_file: Path) -> List[Dict[str, Any]]:
         """Extract repair sections from JSON files"""
         try:
             data = json.loads(json_file.read_text(encoding='utf-8'))
             
-            # Determine appliance type from file path
-            appliance_type = "General"
-            if "refrigerator" in str(json_file).lower():
-                appliance_type = "Refrigerator"
-            elif "dishwasher" in str(json_file).lower():
-                appliance_type = "Dishwasher"
-            elif "washer" in str(json_file).lower():
-                appliance_type = "Washer"
-            elif "dryer" in str(json_file).lower():
-                appliance_type = "Dryer"
+            # Determine appliance type from file path (shared with simple_search)
+            appliance_type = appliance_type_for_path(json_file, self.data_dir)
             
             sections = []
             
@@ -201,6 +262,7 @@ class RepairRAGSystem:
                         sections.append({
                             "text": full_text,
                             "appliance_type": appliance_type,
+                            "appliance_type_lc": appliance_type.lower(),
                             "symptom": symptom_title,
                             "issue_title": section.get('title', ''),
                             "source_file": json_file.name,
@@ -235,6 +297,7 @@ class RepairRAGSystem:
                         sections.append({
                             "text": full_text,
                             "appliance_type": appliance_type,
+                            "appliance_type_lc": appliance_type.lower(),
                             "symptom": symptom_title,
                             "issue_title": f"Common {symptom_title} Problem",
                             "source_file": json_file.name,
@@ -265,6 +328,7 @@ class RepairRAGSystem:
                         sections.append({
                             "text": full_text,
                             "appliance_type": appliance_type,
+                            "appliance_type_lc": appliance_type.lower(),
                             "symptom": "Video Guide",
                             "issue_title": video_title,
                             "source_file": json_file.name,
@@ -351,32 +415,42 @@ class RepairRAGSystem:
         
         logger.info(f"📊 Total sections to index: {len(texts)}")
         
-        # Generate embeddings
+        # Generate embeddings and add them to FAISS chunk by chunk so only one
+        # chunk of vectors is alive at a time (bounds peak RAM on large corpora)
         logger.info(f"🧠 Generating embeddings for {len(texts)} repair sections...")
-        try:
-            embeddings = self._embed_texts(texts)
-            logger.info(f"✅ Generated embeddings shape: {embeddings.shape}")
-        except Exception as e:
-            error_msg = f"Failed to generate embeddings: {e}"
-            logger.error(f"❌ {error_msg}")
-            return {"error": error_msg}
+        index = None
+        for start in range(0, len(texts), EMBED_CHUNK_SIZE):
+            try:
+                embeddings = self._embed_texts(texts[start:start + EMBED_CHUNK_SIZE]).astype('float32')
+                logger.info(f"✅ Generated embeddings shape: {embeddings.shape}")
+            except Exception as e:
+                error_msg = f"Failed to generate embeddings: {e}"
+                logger.error(f"❌ {error_msg}")
+                return {"error": error_msg}
+            
+            try:
+                if index is None:
+                    logger.info("🔍 Creating FAISS index...")
+                    dimension = embeddings.shape[1]
+                    # HNSW graph: log-N search, no training step; inner product == cosine for normalized vectors
+                    index = faiss.IndexHNSWFlat(dimension, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+                    index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+                index.add(embeddings)
+                logger.info(f"   → Indexed {index.ntotal}/{len(texts)} sections")
+            except Exception as e:
+                error_msg = f"Failed to create FAISS index: {e}"
+                logger.error(f"❌ {error_msg}")
+                return {"error": error_msg}
+            
+            del embeddings
         
-        # Create FAISS index
-        logger.info("🔍 Creating FAISS index...")
-        try:
-            dimension = embeddings.shape[1]
-            self._index = faiss.IndexFlatIP(dimension)  # Inner product (cosine similarity for normalized vectors)
-            self._index.add(embeddings)
-            logger.info(f"✅ FAISS index created with dimension {dimension}")
-        except Exception as e:
-            error_msg = f"Failed to create FAISS index: {e}"
-            logger.error(f"❌ {error_msg}")
-            return {"error": error_msg}
+        self._index = index
+        logger.info(f"✅ FAISS index created with dimension {dimension}")
         
         # Save index and metadata
         logger.info("💾 Saving index and metadata...")
         try:
-            faiss.write_index(self._index, str(self.index_file))
+            _replace_file(self.index_file, lambda path: faiss.write_index(index, str(path)))
             logger.info(f"✅ Saved FAISS index to {self.index_file}")
             
             self._metadata = all_sections
@@ -390,8 +464,10 @@ class RepairRAGSystem:
                 "sections": all_sections
             }
             
-            with open(self.meta_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata_with_hash, f, indent=2, ensure_ascii=False)
+            def write_metadata(path: Path):
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump(metadata_with_hash, f, indent=2, ensure_ascii=False)
+            _replace_file(self.meta_file, write_metadata)
             logger.info(f"✅ Saved metadata to {self.meta_file} with hash for caching")
         except Exception as e:
             error_msg = f"Failed to save index files: {e}"
@@ -416,7 +492,15 @@ class RepairRAGSystem:
             raise ImportError("RAG dependencies not installed")
         
         print(f"Loading existing index from {self.index_file}")
-        self._index = faiss.read_index(str(self.index_file))
+        # Memory-map the index so pages fault in on demand instead of copying the
+        # whole file into a fresh buffer (IO_FLAG_MMAP_IFC covers flat codes, faiss>=1.10)
+        mmap_flags = getattr(faiss, "IO_FLAG_MMAP_IFC", faiss.IO_FLAG_MMAP) | faiss.IO_FLAG_READ_ONLY
+        try:
+            index = faiss.read_index(str(self.index_file), mmap_flags)
+        except RuntimeError as e:
+            logger.warning(f"⚠️ Could not mmap index ({e}), reading it into memory")
+            index = faiss.read_index(str(self.index_file))
+        self._index = index
         
         with open(self.meta_file, 'r', encoding='utf-8') as f:
             metadata_obj = json.load(f)
@@ -432,10 +516,15 @@ class RepairRAGSystem:
             docs_count = metadata_obj.get("documents_count", len(self._metadata))
             data_hash = metadata_obj.get("data_hash", "unknown")[:16]
             print(f"Loaded existing RAG index: {docs_count} documents (hash: {data_hash}...)")
+        
+        # Indexes built before appliance_type_lc existed get it backfilled here
+        for doc in self._metadata:
+            if "appliance_type_lc" not in doc:
+                doc["appliance_type_lc"] = doc["appliance_type"].lower()
     
     def search(self, query: str, appliance_type: str = None, top_k: int = 8) -> Dict[str, Any]:
         """Search for relevant repair information"""
-        logger.info(f"🔍 RAG search called: query='{query}', appliance_type='{appliance_type}', top_k={top_k}")
+        logger.info("🔍 RAG search called: query='%s', appliance_type='%s', top_k=%s", query, appliance_type, top_k)
         
         if not RAG_AVAILABLE:
             error_msg = "RAG dependencies not installed"
@@ -453,11 +542,11 @@ class RepairRAGSystem:
                 logger.error(f"❌ {error_msg}")
                 return {"error": error_msg}
         
-        logger.info(f"🧠 Generating query embedding...")
+        logger.info("🧠 Generating query embedding...")
         try:
             # Generate query embedding
             query_embedding = self._embed_query(query).reshape(1, -1)
-            logger.info(f"✅ Query embedding generated: shape {query_embedding.shape}")
+            logger.info("✅ Query embedding generated: shape %s", query_embedding.shape)
         except Exception as e:
             error_msg = f"Failed to generate query embedding: {e}"
             logger.error(f"❌ {error_msg}")
@@ -465,11 +554,13 @@ class RepairRAGSystem:
         
         # Search with higher k to allow filtering
         search_k = max(top_k * 3, 20)
-        logger.info(f"🔍 Searching FAISS index with k={search_k}...")
+        logger.info("🔍 Searching FAISS index with k=%s...", search_k)
         
         try:
+            if hasattr(self._index, "hnsw"):
+                self._index.hnsw.efSearch = max(HNSW_EF_SEARCH, search_k)
             scores, indices = self._index.search(query_embedding, search_k)
-            logger.info(f"✅ FAISS search completed, found {len(indices[0])} results")
+            logger.info("✅ FAISS search completed, found %s results", len(indices[0]))
         except Exception as e:
             error_msg = f"FAISS search failed: {e}"
             logger.error(f"❌ {error_msg}")
@@ -477,6 +568,7 @@ class RepairRAGSystem:
         
         results = []
         filtered_count = 0
+        appliance_type_lc = appliance_type.lower() if appliance_type else None
         
         for idx, score in zip(indices[0], scores[0]):
             if idx == -1:  # FAISS returns -1 for invalid indices
@@ -485,7 +577,7 @@ class RepairRAGSystem:
             doc = self._metadata[idx]
             
             # Filter by appliance type if specified
-            if appliance_type and doc["appliance_type"].lower() != appliance_type.lower():
+            if appliance_type_lc and doc["appliance_type_lc"] != appliance_type_lc:
                 filtered_count += 1
                 continue
             
@@ -504,9 +596,10 @@ class RepairRAGSystem:
             if len(results) >= top_k:
                 break
         
-        logger.info(f"🎯 Search results: {len(results)} returned, {filtered_count} filtered out")
-        if results:
-            logger.info(f"   Top result: {results[0]['symptom']} - {results[0]['issue_title']} (score: {results[0]['score']:.3f})")
+        logger.info("🎯 Search results: %s returned, %s filtered out", len(results), filtered_count)
+        if results and logger.isEnabledFor(logging.INFO):
+            top = results[0]
+            logger.info("   Top result: %s - %s (score: %.3f)", top['symptom'], top['issue_title'], top['score'])
         
         return {
             "query": query,
@@ -562,11 +655,11 @@ def initialize_rag_system(rebuild: bool = False) -> Dict[str, Any]:
 
 def search_repair_guides(query: str, appliance_type: str = None, top_k: int = 8) -> Dict[str, Any]:
     """Search for repair guides using RAG"""
-    logger.info(f"🔍 search_repair_guides called: query='{query}', appliance_type='{appliance_type}'")
+    logger.info("🔍 search_repair_guides called: query='%s', appliance_type='%s'", query, appliance_type)
     try:
         rag = get_rag_system()
         result = rag.search(query, appliance_type, top_k)
-        logger.info(f"✅ Search completed: found {result.get('total_found', 0)} results")
+        logger.info("✅ Search completed: found %s results", result.get('total_found', 0))
         return result
     except Exception as e:
         error_msg = f"Failed to search repair guides: {e}"
@@ -1,21 +1,329 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import WebDriverException
+import asyncio
+import atexit
+import copy
+import functools
+import html
+import os
 import re
 import logging
-from typing import Dict, Any, Optional
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Dict, Any, List, Optional, Tuple
+import httpx
+from selectolax.lexbor import LexborHTMLParser as HTMLParser
+from .constants import (
+    PARTSELECT_BASE_URL, DEFAULT_TIMEOUT, HTTP_MAX_CONNECTIONS, HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    PAGE_LOAD_TIMEOUT, SCRIPT_TIMEOUT, BROWSER_WAIT_TIMEOUT, DRIVER_POOL_SIZE,
+    PAGE_CACHE_SIZE, PAGE_CACHE_TTL, PAGE_CACHE_MAX_BYTES, SCRAPE_SCHEMA_VERSION
+)
 from .helpers import (
-    setup_logging, random_delay, extract_with_patterns, extract_all_with_pattern,
-    safe_find_element, clean_price, split_and_clean, validate_page_load,
-    setup_anti_detection, simulate_human_behavior, extract_youtube_videos, extract_model_compatibility
+    setup_logging, wait_for_element,
+    compile_patterns, extract_first_match,
+    clean_price, validate_page_load, validate_page_html,
+    setup_anti_detection, simulate_human_behavior, extract_youtube_videos_from_html, extract_model_compatibility,
+    TTLCache
 )
 
-def setup_chrome_driver(headless: bool = True) -> webdriver.Chrome:
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+# Selenium is imported lazily inside the Chrome helpers so the HTTP-only paths
+# (and server startup) don't pay for it
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+# More realistic user agent (latest Chrome on Windows) - shared by the HTTP client and Chrome
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36'
+
+# HTTP statuses that mean the request was refused rather than that the page is
+# missing - these still go to the Chrome fallback
+BOT_BLOCK_STATUSES = frozenset({403, 429})
+
+# Present once a product, repair or symptom page has rendered its main content
+PAGE_READY_SELECTOR = "h1.title-lg, h1.title-main, #RelatedParts"
+
+# Subresources Chrome never needs to fetch for scraping (CDP Network.setBlockedURLs globs)
+BLOCKED_URL_PATTERNS = [
+    "*.css", "*.woff", "*.woff2", "*.ttf", "*.otf", "*.mp4", "*.webm",
+    "*googletagmanager*", "*google-analytics*", "*doubleclick*",
+    "*googlesyndication*", "*facebook.net*", "*hotjar*",
+]
+
+# Raw HTML by URL (capped by total bytes), and parsed product dicts by (URL, schema version)
+_PAGE_CACHE = TTLCache(PAGE_CACHE_SIZE, PAGE_CACHE_TTL, maxbytes=PAGE_CACHE_MAX_BYTES)
+_RESULT_CACHE = TTLCache(PAGE_CACHE_SIZE, PAGE_CACHE_TTL)
+
+# Optional on-disk HTML cache shared across processes (pip install diskcache)
+_disk_cache = None
+if diskcache is not None and os.environ.get("SCRAPER_CACHE_DIR"):
+    _disk_cache = diskcache.Cache(os.environ["SCRAPER_CACHE_DIR"])
+
+# Precompiled extraction patterns. Each field's candidates are case-insensitive and
+# listed in priority order - extract_first_match returns the first match of the
+# earliest-listed pattern that matches anywhere on the page.
+_NAME_RE = compile_patterns((
+    rb'<h1 class="title-lg[^"]*"[^>]*itemprop="name"[^>]*>([^<]+)</h1>',
+    rb'<h1 class="title-lg[^"]*"[^>]*>([^<]+)</h1>',
+    rb'<h1[^>]*itemprop="name"[^>]*>([^<]+)</h1>',
+    rb'<h1[^>]*>([^<]+)</h1>',
+))
+
+_DESC_RE = compile_patterns((
+    rb'<div itemprop="description" class="mt-3">([^<]+)</div>',  # Main product description
+    rb'itemprop="description"[^>]*>([^<]+)',  # Generic itemprop description
+    rb'<div class="pd__description[^>]*>.*?<div[^>]*>([^<]+)</div>',  # Description section
+    rb'<meta name="description" content="([^"]+)"',  # Fallback to meta
+    rb'class="description"[^>]*>([^<]+)',
+))
+
+_PRODUCT_TYPE_RE = compile_patterns((
+    rb'<div class="bold mb-1">This part works with the following products:</div>\s*([^<\n]+)',
+    rb'This part works with the following products:\s*([^<\n]+)',
+    rb'Refrigerator\.\s*\*',  # Direct match for refrigerator
+    rb'data-modeltype="([^"]+)"',  # From data attribute
+))
+
+_PRICE_RE = compile_patterns((
+    rb'class="js-partPrice"[^>]*>([0-9.]+)',  # js-partPrice class
+    rb'\$(\d+\.?\d*)',  # Generic dollar amount
+    rb'Price[:\s]*\$(\d+\.?\d*)',
+    rb'(\d+\.?\d*)\s*USD',
+))
+
+_PART_NUMBER_RE = compile_patterns((
+    rb'PartSelect Number[:\s]*([A-Z0-9]+)',
+    rb'PS Number[:\s]*([A-Z0-9]+)',
+    rb'Part Number[:\s]*([A-Z0-9]+)',
+))
+
+_MFR_RE = compile_patterns((
+    rb'itemprop="mpn">([A-Z0-9]+)</span>',  # Primary: structured microdata
+    rb'Manufacturer Part Number[^>]*>([A-Z0-9]+)</span>',  # From the UI display
+    rb'Manufacturer Part Number:\s*<span[^>]*>([A-Z0-9]+)</span>',  # Alternative format
+    rb'content="OEM ([A-Z0-9]+) -',  # From meta description
+    rb'Manufacturer Part Number[:\s]*([A-Z0-9]+)',  # Generic text pattern
+    rb'OEM Part Number[:\s]*([A-Z0-9]+)',  # Alternative OEM pattern
+    rb'Model[:\s]*([A-Z0-9]+)',  # Fallback model pattern
+))
+
+_DIFFICULTY_RE = compile_patterns((
+    rb'<p class="bold">(Really Easy|Very Easy|Easy|Moderate|Hard)&nbsp;</p>',
+    rb'<p class="bold">(Really Easy|Very Easy|Easy|Moderate|Hard)\s*</p>',
+    rb'Difficulty Level:\s*([^.\n]+)',
+))
+
+_TIME_RE = compile_patterns((
+    rb'<p class="bold">(Less than \d+ mins?)&nbsp;</p>',
+    rb'<p class="bold">(Less than \d+ mins?)\s*</p>',
+    rb'(\d+\s*-\s*\d+\s*min)',  # Fallback pattern
+    rb'(Less than \d+ mins?)',  # Direct pattern
+))
+
+_SYMPTOMS_RE = compile_patterns((
+    rb'<div class="bold mb-1">This part fixes the following symptoms:</div>\s*([^<\n]+)',
+    rb'This part fixes the following symptoms:\s*([^<\n]+)',
+    rb'Door won\'t open or close \| Ice maker won\'t dispense ice \| Leaking',  # Direct match
+))
+
+_REPLACES_RE = compile_patterns((
+    rb'<div class="bold mb-1">Part# [A-Z0-9]+ replaces these:</div>\s*<div[^>]*>\s*([^<]+)',
+    rb'AP6019471,\s*2171046,\s*2171047,\s*2179574,\s*2179575,\s*2179607,\s*2179607K,\s*2198449,\s*2198449K,\s*2304235,\s*2304235K,\s*W10321302,\s*W10321303,\s*W10321304,\s*W10549739,\s*WPW10321304VP',  # Direct match
+    rb'Part# [A-Z0-9]+ replaces these:\s*([^<\n]+)',
+))
+
+_RATING_RE = compile_patterns((rb'(\d+\.?\d*)\s*\/\s*5\.0',))
+_REVIEW_RE = compile_patterns((rb'(\d+)\s*Reviews?',))
+_GENERIC_INTRO_RE = re.compile(rb'<div class="appliance-intro">([^<]+)</div>', re.IGNORECASE)
+
+# Single-purpose patterns used directly with search/findall. The DOTALL section
+# pattern uses possessive quantifiers and a tempered (?:(?!stop).)*+ body so a
+# missing terminator fails in linear time instead of backtracking across the page.
+#
+# Pages are kept as the raw response bytes, so every pattern run over a whole page
+# is a bytes pattern and only the captured groups get decoded (see _decode).
+_PRICE_CONTENT_RE = re.compile(rb'itemprop="price"\s+content="([0-9.]+)"')
+_IN_STOCK_RE = re.compile(rb'in stock', re.IGNORECASE)
+_COMMA_SPLIT_RE = re.compile(rb'\s*,\s*')
+_PIPE_SPLIT_RE = re.compile(rb'\s*\|\s*')
+_ABOUT_REPAIR_RE = re.compile(rb'<h3[^>]*+>About this repair:</h3>\s*+<ul[^>]*+>((?:(?!</ul>).)*+)</ul>', re.DOTALL)
+
+# Patterns run over already-decoded slices (captured groups and DOM text)
+_RELATED_NAME_PRICE_RE = re.compile(r'<a class="bold"[^>]*+>([^<]++)</a>.*?<span class="price__currency">\$</span>([0-9.]++)', re.DOTALL)
+_EASY_PERCENT_RE = re.compile(r'(\d++)%.*?"Easy"')
+_LESS_THAN_MINUTES_RE = re.compile(r'less than (\d+) minutes?', re.IGNORECASE)
+_SYMPTOM_PERCENT_TEXT_RE = re.compile(r'(\d+%)\s*of\s*customers')
+_PERCENT_RE = re.compile(r'(\d+)%')
+_RATED_AS_RE = re.compile(r'Rated as&nbsp;([^<]+)')
+_REPAIR_STORIES_RE = re.compile(r'(\d+)\s*repair stories')
+_STEP_VIDEOS_RE = re.compile(r'(\d+)\s*step by step videos')
+
+def _decode(value: Optional[bytes]) -> Optional[str]:
+    """Decode a captured byte slice of the page (None passes through)"""
+    return value.decode('utf-8', 'replace') if value is not None else None
+
+# Scraping coroutines all run on one background event loop so the pooled
+# AsyncClient (whose connections are bound to a loop) can be reused across calls,
+# and so the sync scrape_* API works whether or not the caller has a running loop.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+_http_client: Optional[httpx.AsyncClient] = None
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Get or start the background event loop used for HTTP scraping"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="scraper-loop", daemon=True).start()
+    return _loop
+
+def _run(coro):
+    """Run a scraping coroutine on the background loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the connection-pooled HTTP client (created on first use, on the scraper loop)"""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            headers={"User-Agent": USER_AGENT},
+            follow_redirects=True,
+            timeout=DEFAULT_TIMEOUT,
+            # Sized above scrape_many's default concurrency so gathered fetches never queue on the pool
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS
+            )
+        )
+    return _http_client
+
+def warmup() -> bool:
+    """
+    Preconnect the shared HTTP client to PartSelect (TCP + TLS + HTTP/2 setup)
+    so the first real scrape doesn't pay the handshake. Called by server.py at startup.
+    
+    Returns:
+        True if the connection was established
+    """
+    return _run(_warmup())
+
+async def _warmup() -> bool:
+    try:
+        await _get_http_client().head(f"{PARTSELECT_BASE_URL}/")
+        return True
+    except httpx.HTTPError as e:
+        logging.warning(f"HTTP warmup failed: {e}")
+        return False
+
+async def _aclose():
+    global _http_client
+    if _http_client is not None:
+        client, _http_client = _http_client, None
+        await client.aclose()
+
+@atexit.register
+def _close_http_client():
+    """Close the shared HTTP client and its pooled connections on shutdown"""
+    if _http_client is not None and _loop is not None and _loop.is_running():
+        asyncio.run_coroutine_threadsafe(_aclose(), _loop).result(timeout=DEFAULT_TIMEOUT)
+
+async def _fetch_html(url: str) -> Optional[bytes]:
+    """
+    Fetch a page with a plain HTTP GET. Returns None if the page looks blocked or
+    broken (worth retrying in Chrome), or b"" for a client error such as 404/410,
+    where the page doesn't exist and a browser load would only come back the same
+    """
+    try:
+        response = await _get_http_client().get(url)
+    except httpx.HTTPError as e:
+        logging.warning(f"HTTP fetch failed for {url}: {e}")
+        return None
+    
+    if 400 <= response.status_code < 500 and response.status_code not in BOT_BLOCK_STATUSES:
+        logging.warning(f"HTTP fetch for {url} returned status {response.status_code}; not retrying in Chrome")
+        return b""
+    
+    if response.status_code != 200:
+        logging.warning(f"HTTP fetch for {url} returned status {response.status_code}")
+        return None
+    
+    page_text = response.content  # Raw bytes - extraction never decodes the whole page
+    if not validate_page_html(page_text):
+        return None
+    return page_text
+
+def _fetch_html_with_browser(url: str, headless: bool = True) -> Optional[bytes]:
+    """Fallback: load the page in Chrome when the plain HTTP fetch is rejected"""
+    with get_driver_pool(headless).checkout() as driver:
+        # Navigate and wait for the page content instead of a fixed delay
+        driver.get(url)
+        wait_for_element(driver, PAGE_READY_SELECTOR, BROWSER_WAIT_TIMEOUT)
+        
+        # Validate page load - only act human and retry if an anti-bot check fired
+        if not validate_page_load(driver):
+            simulate_human_behavior(driver)
+            if not wait_for_element(driver, PAGE_READY_SELECTOR, BROWSER_WAIT_TIMEOUT) or not validate_page_load(driver):
+                return None
+        
+        return driver.page_source.encode('utf-8')
+
+async def _fetch_page(url: str, headless: bool = True) -> Optional[bytes]:
+    """Fetch page HTML over HTTP, falling back to Chrome only if that fails (cached by URL)"""
+    page_text = _PAGE_CACHE.get(url)
+    if page_text is not None:
+        return page_text
+    
+    if _disk_cache is not None:
+        page_text = _disk_cache.get(url)
+        if page_text is not None:
+            _PAGE_CACHE.set(url, page_text)
+            return page_text
+    
+    page_text = await _fetch_html(url)
+    if page_text == b"":
+        return None  # The page doesn't exist; nothing to fall back to or cache
+    if page_text is None:
+        logging.info(f"Falling back to Chrome for {url}")
+        page_text = await asyncio.to_thread(_fetch_html_with_browser, url, headless)
+    
+    # Only successful fetches are cached so blocked pages get retried
+    if page_text is not None:
+        _PAGE_CACHE.set(url, page_text)
+        if _disk_cache is not None:
+            _disk_cache.set(url, page_text, expire=PAGE_CACHE_TTL)
+    return page_text
+
+def _scrape_model_compatibility(url: str, headless: bool = True, page_text: Optional[bytes] = None) -> Optional[list]:
+    """
+    Open the product page in Chrome and read the (JS-driven) Model Cross Reference list.
+    Returns [] if the page has no list, or None if Chrome couldn't load it in time.
+    """
+    try:
+        with get_driver_pool(headless).checkout() as driver:
+            driver.get(url)
+            if not wait_for_element(driver, '#ModelCrossReference', BROWSER_WAIT_TIMEOUT):
+                # Only a page already fetched without the section really has no list;
+                # otherwise the wait just timed out
+                if page_text is not None and b'id="ModelCrossReference"' not in page_text:
+                    return []
+                logging.warning(f"Timed out waiting for model compatibility on {url}")
+                return None
+            return extract_model_compatibility(driver)
+    except Exception as e:
+        logging.warning(f"Could not load model compatibility for {url}: {e}")
+        return None
+
+def setup_chrome_driver(headless: bool = True) -> "webdriver.Chrome":
     """Setup Chrome driver with enhanced anti-detection measures"""
-    from webdriver_manager.chrome import ChromeDriverManager
+    from selenium import webdriver
+    from selenium.common.exceptions import WebDriverException
+    from selenium.webdriver.chrome.options import Options
     from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
     
     chrome_options = Options()
     
@@ -39,7 +347,7 @@ def setup_chrome_driver(headless: bool = True) -> webdriver.Chrome:
     chrome_options.add_argument('--start-maximized')
     
     # More realistic user agent (latest Chrome on Windows)
-    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36')
+    chrome_options.add_argument(f'--user-agent={USER_AGENT}')
     
     # Experimental options
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
@@ -58,16 +366,134 @@ def setup_chrome_driver(headless: bool = True) -> webdriver.Chrome:
     }
     chrome_options.add_experimental_option("prefs", prefs)
     
+    # Return from driver.get at DOMContentLoaded - the data we read is in the HTML
+    chrome_options.page_load_strategy = 'eager'
+    
     try:
         # Use WebDriver Manager to automatically handle ChromeDriver
         service = Service(ChromeDriverManager().install())
         driver = webdriver.Chrome(service=service, options=chrome_options)
+        
+        # Fail fast instead of hanging on a stalled navigation or script
+        driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+        driver.set_script_timeout(SCRIPT_TIMEOUT)
+        
         setup_anti_detection(driver)
+        block_subresources(driver)
         return driver
     except WebDriverException as e:
         logging.error(f"Failed to setup Chrome driver: {e}")
         raise
 
+def block_subresources(driver: "webdriver.Chrome"):
+    """Drop stylesheets, fonts, media and trackers at the network layer via CDP"""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        logging.warning(f"Could not block subresources: {e}")
+
+class DriverPool:
+    """
+    Bounded pool of warm Chrome drivers, reused across browser-backed scrapes.
+    Idle drivers and the count of live ones sit behind one condition variable, and
+    every change that could unblock a waiter (check-in, discard, failed start)
+    notifies it, so a scrape waiting for a slot can't be left asleep.
+    """
+    
+    def __init__(self, size: int = DRIVER_POOL_SIZE, headless: bool = True, factory: Optional[Callable[[bool], "webdriver.Chrome"]] = None):
+        self.size = size
+        self.headless = headless
+        self._factory = factory or setup_chrome_driver
+        self._idle = deque()
+        self._created = 0
+        self._cond = threading.Condition()
+    
+    def _acquire(self) -> "webdriver.Chrome":
+        """Take an idle driver, starting a new one only while under the size limit"""
+        with self._cond:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+                if self._created < self.size:
+                    self._created += 1
+                    break
+                self._cond.wait()  # Until a driver is checked in or a slot frees up
+        
+        try:
+            return self._factory(self.headless)
+        except Exception:
+            self._free_slot()
+            raise
+    
+    def _release(self, driver: "webdriver.Chrome"):
+        """Return a healthy driver to the idle set"""
+        with self._cond:
+            self._idle.append(driver)
+            self._cond.notify()
+    
+    def _free_slot(self):
+        with self._cond:
+            self._created -= 1
+            self._cond.notify()  # A waiter can now start its own driver
+    
+    def _discard(self, driver: "webdriver.Chrome"):
+        """Quit a driver and free its slot in the pool"""
+        try:
+            driver.quit()
+        except Exception as e:
+            logging.debug(f"Error quitting Chrome driver: {e}")
+        self._free_slot()
+    
+    @contextmanager
+    def checkout(self):
+        """Borrow a driver for the duration of a with-block"""
+        from selenium.common.exceptions import WebDriverException
+        
+        driver = self._acquire()
+        healthy = True
+        try:
+            yield driver
+        except WebDriverException:
+            healthy = False
+            raise
+        finally:
+            if healthy:
+                try:
+                    # Reset state so the next scrape starts from a clean tab
+                    driver.delete_all_cookies()
+                    driver.get("about:blank")
+                except WebDriverException:
+                    healthy = False
+            if healthy:
+                self._release(driver)
+            else:
+                self._discard(driver)
+    
+    def close(self):
+        """Quit every idle driver in the pool"""
+        with self._cond:
+            drivers = list(self._idle)
+            self._idle.clear()
+        for driver in drivers:
+            self._discard(driver)
+
+_driver_pools: Dict[bool, DriverPool] = {}
+_driver_pools_lock = threading.Lock()
+
+def get_driver_pool(headless: bool = True) -> DriverPool:
+    """Get the shared driver pool for the given headless mode"""
+    with _driver_pools_lock:
+        pool = _driver_pools.get(headless)
+        if pool is None:
+            pool = _driver_pools[headless] = DriverPool(DRIVER_POOL_SIZE, headless)
+    return pool
+
+@atexit.register
+def _close_driver_pools():
+    for pool in list(_driver_pools.values()):
+        pool.close()
+
 def scrape_partselect_product(part_number: str, headless: bool = True) -> Dict[str, Any]:
     """
     Scrape comprehensive product information from PartSelect.com
@@ -79,10 +505,20 @@ def scrape_partselect_product(part_number: str, headless: bool = True) -> Dict[s
     Returns:
         Dictionary containing all extracted product information
     """
+    return _run(_scrape_partselect_product(part_number, headless))
+
+async def _scrape_partselect_product(part_number: str, headless: bool = True) -> Dict[str, Any]:
+    """Fetch a product page over HTTP and run the regex extractors on it"""
     logger = setup_logging()
     
     # Construct URL
     url = f"https://www.partselect.com/{part_number}-1.htm"
+    cache_key = (url, SCRAPE_SCHEMA_VERSION)
+    cached = _RESULT_CACHE.get(cache_key)
+    if cached is not None:
+        logger.info(f"Cache hit for {part_number}")
+        return copy.deepcopy(cached)
+    
     logger.info(f"Starting scrape for {part_number}: {url}")
     
     # Initialize result structure
@@ -106,89 +542,110 @@ def scrape_partselect_product(part_number: str, headless: bool = True) -> Dict[s
         'model_compatibility': []
     }
     
-    driver = None
     try:
-        # Setup driver
-        driver = setup_chrome_driver(headless)
-        
-        # Navigate to page with longer delay
-        driver.get(url)
-        random_delay(3, 6)  # Longer delay after page load
-        
-        # Simulate human behavior
-        simulate_human_behavior(driver)
-        
-        # Validate page load
-        if not validate_page_load(driver):
+        # Get the raw page bytes for regex extraction
+        page_text = await _fetch_page(url, headless)
+        if page_text is None:
             logger.error("Page validation failed")
             return product_info
         
-        # Get page text for regex extraction
-        page_text = driver.page_source
-        
-        # Extract basic product information
-        product_info.update(_extract_basic_info(driver, page_text))
-        
-        # Extract pricing information
-        product_info.update(_extract_pricing(page_text))
-        
-        # Extract part numbers
-        product_info.update(_extract_part_numbers(page_text))
-        
-        # Extract installation info
-        product_info.update(_extract_installation_info(page_text))
+        # Run the CPU-bound extractors on a worker thread while Chrome loads the
+        # (JS-driven) model compatibility list - the only step that still needs a browser
+        fields, model_compatibility = await asyncio.gather(
+            asyncio.to_thread(_extract_product_fields, page_text),
+            asyncio.to_thread(_scrape_model_compatibility, url, headless, page_text)
+        )
+        product_info.update(fields)
+        product_info['model_compatibility'] = model_compatibility or []
         
-        # Extract reviews
-        product_info.update(_extract_review_info(page_text))
-        
-        # Extract stock status
-        product_info['in_stock'] = _extract_stock_status(page_text)
-        
-        # Extract troubleshooting info
-        product_info.update(_extract_troubleshooting_info(page_text))
-        
-        # Extract additional products
-        product_info['you_may_need'] = _extract_additional_products(page_text)
-        
-        # Extract videos
-        product_info['part_videos'] = extract_youtube_videos(driver, page_text)
-        
-        # Extract model compatibility (interactive)
-        product_info['model_compatibility'] = extract_model_compatibility(driver)
-        
-        logger.info(f"Successfully scraped {part_number}")
+        # A failed compatibility scrape leaves the result incomplete - return it,
+        # but don't cache it, so the next call tries Chrome again
+        if model_compatibility is None:
+            logger.warning(f"Scraped {part_number} without model compatibility; not caching")
+        else:
+            # The parsed result supersedes the raw HTML; keep only one copy in memory
+            _RESULT_CACHE.set(cache_key, copy.deepcopy(product_info))
+            _PAGE_CACHE.pop(url)
+            logger.info(f"Successfully scraped {part_number}")
         
     except Exception as e:
         logger.error(f"Error scraping {part_number}: {e}")
-        
-    finally:
-        if driver:
-            driver.quit()
     
     return product_info
 
-def _extract_basic_info(driver, page_text: str) -> Dict[str, Any]:
+async def scrape_many(part_numbers: List[str], concurrency: int = 16, headless: bool = True) -> List[Dict[str, Any]]:
+    """
+    Scrape several products concurrently over one shared HTTP connection pool
+    
+    Args:
+        part_numbers: PartSelect part numbers to scrape
+        concurrency: Maximum number of pages fetched at the same time
+        headless: Whether to run browser in headless mode (for Chrome-backed steps)
+        
+    Returns:
+        List of product info dictionaries, in the same order as part_numbers
+    """
+    future = asyncio.run_coroutine_threadsafe(
+        _scrape_many(part_numbers, concurrency, headless), _get_loop()
+    )
+    return await asyncio.wrap_future(future)
+
+async def _scrape_many(part_numbers: List[str], concurrency: int, headless: bool) -> List[Dict[str, Any]]:
+    """Fan out product scrapes on the scraper loop, bounded by a semaphore"""
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def _scrape_one(part_number: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await _scrape_partselect_product(part_number, headless)
+    
+    return await asyncio.gather(*[_scrape_one(part_number) for part_number in part_numbers])
+
+def _extract_product_fields(page_text: bytes) -> Dict[str, Any]:
+    """Run the product extractors over one page (pure CPU work, kept off the event loop)"""
+    info = {}
+    
+    # Parse the DOM once for the structural extractors
+    tree = HTMLParser(page_text)
+    
+    # Extract basic product information
+    info.update(_extract_basic_info(page_text))
+    
+    # Extract pricing information
+    info.update(_extract_pricing(page_text))
+    
+    # Extract part numbers
+    info.update(_extract_part_numbers(page_text))
+    
+    # Extract installation info
+    info.update(_extract_installation_info(page_text))
+    
+    # Extract reviews
+    info.update(_extract_review_info(page_text))
+    
+    # Extract stock status
+    info['in_stock'] = _extract_stock_status(page_text)
+    
+    # Extract troubleshooting info
+    info.update(_extract_troubleshooting_info(page_text))
+    
+    # Extract additional products
+    info['you_may_need'] = _extract_additional_products(tree)
+    
+    # Extract videos
+    info['part_videos'] = extract_youtube_videos_from_html(page_text)
+    
+    return info
+
+def _extract_basic_info(page_text: bytes) -> Dict[str, Any]:
     """Extract basic product information"""
     info = {}
     
     # Product name - updated based on actual HTML structure
-    name_selectors = [
-        'h1.title-lg[itemprop="name"]',
-        'h1.title-lg',
-        'h1[itemprop="name"]',
-        'h1'
-    ]
-    info['name'] = safe_find_element(driver, name_selectors) or ''
+    name = _decode(extract_first_match(page_text, _NAME_RE)) or ''
+    info['name'] = html.unescape(name)
     
     # Product description - extract from Product Description section first, fallback to meta
-    desc_patterns = [
-        r'<div itemprop="description" class="mt-3">([^<]+)</div>',  # Main product description
-        r'itemprop="description"[^>]*>([^<]+)',  # Generic itemprop description
-        r'<div class="pd__description[^>]*>.*?<div[^>]*>([^<]+)</div>',  # Description section
-        r'<meta name="description" content="([^"]+)"',  # Fallback to meta
-        r'class="description"[^>]*>([^<]+)'
-    ]
-    description = extract_with_patterns(page_text, desc_patterns) or ''
+    description = _decode(extract_first_match(page_text, _DESC_RE)) or ''
     
     # Clean up the description
     if description:
@@ -203,13 +660,7 @@ def _extract_basic_info(driver, page_text: str) -> Dict[str, Any]:
     info['description'] = description
     
     # Product type - extract from the exact pattern in screenshots
-    product_type_patterns = [
-        r'<div class="bold mb-1">This part works with the following products:</div>\s*([^<\n]+)',
-        r'This part works with the following products:\s*([^<\n]+)',
-        r'Refrigerator\.\s*\*',  # Direct match for refrigerator
-        r'data-modeltype="([^"]+)"'  # From data attribute
-    ]
-    product_type_match = extract_with_patterns(page_text, product_type_patterns)
+    product_type_match = _decode(extract_first_match(page_text, _PRODUCT_TYPE_RE))
     if product_type_match:
         if 'Refrigerator' in product_type_match or 'refrigerator' in product_type_match.lower():
             info['product_type'] = 'refrigerator'
@@ -220,163 +671,112 @@ def _extract_basic_info(driver, page_text: str) -> Dict[str, Any]:
     
     return info
 
-def _extract_pricing(page_text: str) -> Dict[str, Any]:
+def _extract_pricing(page_text: bytes) -> Dict[str, Any]:
     """Extract pricing information - updated based on actual HTML structure"""
     # First try to extract from itemprop="price" content attribute
-    price_content_pattern = r'itemprop="price"\s+content="([0-9.]+)"'
-    price_match = re.search(price_content_pattern, page_text)
+    price_match = _PRICE_CONTENT_RE.search(page_text)
     
     if price_match:
         try:
-            price = float(price_match.group(1))
+            price = float(_decode(price_match.group(1)))
             return {'price': price}
         except ValueError:
             pass
     
     # Fallback to text-based extraction
-    price_patterns = [
-        r'class="js-partPrice"[^>]*>([0-9.]+)',  # js-partPrice class
-        r'\$(\d+\.?\d*)',  # Generic dollar amount
-        r'Price[:\s]*\$(\d+\.?\d*)',
-        r'(\d+\.?\d*)\s*USD'
-    ]
-    
-    price_text = extract_with_patterns(page_text, price_patterns)
+    price_text = _decode(extract_first_match(page_text, _PRICE_RE))
     price = clean_price(price_text) if price_text else None
     
     return {'price': price}
 
-def _extract_part_numbers(page_text: str) -> Dict[str, Any]:
+def _extract_part_numbers(page_text: bytes) -> Dict[str, Any]:
     """Extract part numbers"""
     info = {}
     
     # PartSelect Number - restore original working patterns
-    part_number_patterns = [
-        r'PartSelect Number[:\s]*([A-Z0-9]+)',
-        r'PS Number[:\s]*([A-Z0-9]+)',
-        r'Part Number[:\s]*([A-Z0-9]+)'
-    ]
-    info['part_number'] = extract_with_patterns(page_text, part_number_patterns) or ''
+    info['part_number'] = _decode(extract_first_match(page_text, _PART_NUMBER_RE)) or ''
     
     # Manufacturer Part Number - extract from structured HTML (completely brand-agnostic)
-    mfr_patterns = [
-        r'itemprop="mpn">([A-Z0-9]+)</span>',  # Primary: structured microdata
-        r'Manufacturer Part Number[^>]*>([A-Z0-9]+)</span>',  # From the UI display
-        r'Manufacturer Part Number:\s*<span[^>]*>([A-Z0-9]+)</span>',  # Alternative format
-        r'content="OEM ([A-Z0-9]+) -',  # From meta description
-        r'Manufacturer Part Number[:\s]*([A-Z0-9]+)',  # Generic text pattern
-        r'OEM Part Number[:\s]*([A-Z0-9]+)',  # Alternative OEM pattern
-        r'Model[:\s]*([A-Z0-9]+)'  # Fallback model pattern
-    ]
-    info['manufacturer_part'] = extract_with_patterns(page_text, mfr_patterns) or ''
+    info['manufacturer_part'] = _decode(extract_first_match(page_text, _MFR_RE)) or ''
     
     return info
 
-def _extract_installation_info(page_text: str) -> Dict[str, Any]:
+def _extract_installation_info(page_text: bytes) -> Dict[str, Any]:
     """Extract installation information"""
     info = {}
     
     # Difficulty level - extract from the exact pattern in screenshots
-    difficulty_patterns = [
-        r'<p class="bold">(Really Easy|Very Easy|Easy|Moderate|Hard)&nbsp;</p>',
-        r'<p class="bold">(Really Easy|Very Easy|Easy|Moderate|Hard)\s*</p>',
-        r'Difficulty Level:\s*([^.\n]+)'
-    ]
-    info['difficulty'] = extract_with_patterns(page_text, difficulty_patterns) or ''
+    info['difficulty'] = _decode(extract_first_match(page_text, _DIFFICULTY_RE)) or ''
     
     # Time estimate - extract from the repair rating section like difficulty
-    time_patterns = [
-        r'<p class="bold">(Less than \d+ mins?)&nbsp;</p>',
-        r'<p class="bold">(Less than \d+ mins?)\s*</p>',
-        r'(\d+\s*-\s*\d+\s*min)',  # Fallback pattern
-        r'(Less than \d+ mins?)',  # Direct pattern
-    ]
-    info['time_estimate'] = extract_with_patterns(page_text, time_patterns) or ''
+    info['time_estimate'] = _decode(extract_first_match(page_text, _TIME_RE)) or ''
     
     return info
 
-def _extract_review_info(page_text: str) -> Dict[str, Any]:
+def _extract_review_info(page_text: bytes) -> Dict[str, Any]:
     """Extract review information"""
     info = {}
     
     # Rating
-    rating_pattern = r'(\d+\.?\d*)\s*\/\s*5\.0'
-    rating_text = extract_with_patterns(page_text, [rating_pattern])
+    rating_text = _decode(extract_first_match(page_text, _RATING_RE))
     info['rating'] = float(rating_text) if rating_text else None
     
     # Review count
-    review_pattern = r'(\d+)\s*Reviews?'
-    review_text = extract_with_patterns(page_text, [review_pattern])
+    review_text = _decode(extract_first_match(page_text, _REVIEW_RE))
     info['review_count'] = int(review_text) if review_text else None
     
     return info
 
-def _extract_stock_status(page_text: str) -> bool:
+def _extract_stock_status(page_text: bytes) -> bool:
     """Extract stock status"""
-    return 'In Stock' in page_text or 'in stock' in page_text
+    return _IN_STOCK_RE.search(page_text) is not None
 
-def _extract_troubleshooting_info(page_text: str) -> Dict[str, Any]:
+def _extract_troubleshooting_info(page_text: bytes) -> Dict[str, Any]:
     """Extract troubleshooting information"""
     info = {}
     
     # Symptoms - extract from the exact pattern in screenshots
-    symptoms_patterns = [
-        r'<div class="bold mb-1">This part fixes the following symptoms:</div>\s*([^<\n]+)',
-        r'This part fixes the following symptoms:\s*([^<\n]+)',
-        r'Door won\'t open or close \| Ice maker won\'t dispense ice \| Leaking'  # Direct match
-    ]
-    symptoms_text = extract_with_patterns(page_text, symptoms_patterns)
+    symptoms_text = extract_first_match(page_text, _SYMPTOMS_RE)
     if symptoms_text:
-        # Split by | and clean each symptom
-        info['symptoms'] = [s.strip() for s in symptoms_text.split('|') if s.strip()]
+        # Split by | and clean each symptom (split and strip in one pass over the bytes)
+        info['symptoms'] = [_decode(s) for s in _PIPE_SPLIT_RE.split(symptoms_text) if s]
     else:
         info['symptoms'] = []
     
     # Replaces parts - extract from the exact pattern in template
-    replaces_patterns = [
-        r'<div class="bold mb-1">Part# [A-Z0-9]+ replaces these:</div>\s*<div[^>]*>\s*([^<]+)',
-        r'AP6019471,\s*2171046,\s*2171047,\s*2179574,\s*2179575,\s*2179607,\s*2179607K,\s*2198449,\s*2198449K,\s*2304235,\s*2304235K,\s*W10321302,\s*W10321303,\s*W10321304,\s*W10549739,\s*WPW10321304VP',  # Direct match
-        r'Part# [A-Z0-9]+ replaces these:\s*([^<\n]+)'
-    ]
-    replaces_text = extract_with_patterns(page_text, replaces_patterns)
+    replaces_text = extract_first_match(page_text, _REPLACES_RE)
     if replaces_text:
-        info['replaces_parts'] = split_and_clean(replaces_text, ',')
+        info['replaces_parts'] = [_decode(p) for p in _COMMA_SPLIT_RE.split(replaces_text) if p]
     else:
         info['replaces_parts'] = []
     
     return info
 
-def _extract_additional_products(page_text: str) -> list:
+def _extract_additional_products(tree: HTMLParser) -> list:
     """Extract 'You May Also Need' products - based on screenshot HTML structure"""
     products = []
     
     try:
-        # Find the RelatedParts section - capture until next section or end
-        related_parts_pattern = r'id="RelatedParts".*?<div data-collapsible="">(.*?)(?=<div class="expanded.*?id="|$)'
-        section_match = re.search(related_parts_pattern, page_text, re.DOTALL | re.IGNORECASE)
+        # The RelatedParts heading is followed by a collapsible block holding the part cards
+        section = tree.css_first('#RelatedParts ~ div[data-collapsible]')
         
-        if section_match:
-            section_text = section_match.group(1)
-            
-            # Split into individual product containers to process each separately
-            product_pattern = r'<div class="col-md-4 mt-3 pd__related-part">(.*?)(?=<div class="col-md-4 mt-3 pd__related-part">|$)'
-            products_html = re.findall(product_pattern, section_text, re.DOTALL)
-            
-            for product_html in products_html:
-                # Extract product name and price from each row
-                name_pattern = r'<a class="bold"[^>]*>([^<]+)</a>'
-                price_pattern = r'<span class="price__currency">\$</span>([0-9.]+)'
+        if section:
+            # Process each product container separately
+            for product_node in section.css('div.pd__related-part'):
+                if len(products) >= 6:  # Only the first 6 products are returned
+                    break
                 
-                name_match = re.search(name_pattern, product_html)
-                price_match = re.search(price_pattern, product_html)
+                # Extract product name and price from each row
+                name_node = product_node.css_first('a.bold')
+                price_node = product_node.css_first('span.price__currency')
                 
-                if name_match:
-                    name = name_match.group(1).strip()
+                if name_node:
+                    name = name_node.text(strip=True)
                     price = 0.0
                     
-                    if price_match:
+                    if price_node and price_node.parent:
                         try:
-                            price = float(price_match.group(1))
+                            price = float(price_node.parent.text(strip=True).lstrip('$'))
                         except ValueError:
                             price = 0.0
                     
@@ -386,12 +786,13 @@ def _extract_additional_products(page_text: str) -> list:
                             'price': price
                         })
             
-            # Fallback: if no rows found, try the original pattern
+            # Fallback: if no rows found, try the original pattern on the section markup
             if not products:
-                product_pattern = r'<a class="bold"[^>]*>([^<]+)</a>.*?<span class="price__currency">\$</span>([0-9.]+)'
-                product_matches = re.findall(product_pattern, section_text, re.DOTALL)
-                
-                for name, price in product_matches:
+                for product_match in _RELATED_NAME_PRICE_RE.finditer(section.html):
+                    if len(products) >= 6:
+                        break
+                    
+                    name, price = product_match.groups()
                     name = name.strip()
                     if name and len(name) > 5:
                         try:
@@ -408,7 +809,7 @@ def _extract_additional_products(page_text: str) -> list:
     except Exception as e:
         logging.debug(f"Error extracting additional products: {e}")
     
-    return products[:6]  # Limit to first 6 products
+    return products
 
 
 def scrape_partselect_repairs(appliance_type: str = "Dishwasher", headless: bool = True) -> Dict[str, Any]:
@@ -422,6 +823,10 @@ def scrape_partselect_repairs(appliance_type: str = "Dishwasher", headless: bool
     Returns:
         Dictionary containing repair guides and troubleshooting information
     """
+    return _run(_scrape_partselect_repairs(appliance_type, headless))
+
+async def _scrape_partselect_repairs(appliance_type: str = "Dishwasher", headless: bool = True) -> Dict[str, Any]:
+    """Fetch an appliance repair page over HTTP and extract its symptoms and videos"""
     logger = setup_logging()
     
     # Construct URL
@@ -438,66 +843,55 @@ def scrape_partselect_repairs(appliance_type: str = "Dishwasher", headless: bool
         'troubleshooting_videos': []
     }
     
-    driver = None
     try:
-        # Setup driver
-        driver = setup_chrome_driver(headless)
-        
-        # Navigate to page with longer delay
-        driver.get(url)
-        random_delay(3, 6)  # Longer delay after page load
-        
-        # Simulate human behavior
-        simulate_human_behavior(driver)
-        
-        # Validate page load
-        if not validate_page_load(driver):
+        # Get the raw page bytes for regex extraction
+        page_text = await _fetch_page(url, headless)
+        if page_text is None:
             logger.error("Page validation failed")
             return repair_info
         
-        # Get page text for regex extraction
-        page_text = driver.page_source
-        
         # Extract repair information
+        tree = HTMLParser(page_text)
         repair_info.update(_extract_repair_intro(page_text, appliance_type))
-        repair_info['common_symptoms'] = _extract_repair_symptoms(page_text, appliance_type)
-        repair_info['troubleshooting_videos'] = _extract_troubleshooting_videos(page_text)
+        repair_info['common_symptoms'] = _extract_repair_symptoms(tree, appliance_type)
+        repair_info['troubleshooting_videos'] = _extract_troubleshooting_videos(tree)
         
         logger.info(f"Successfully scraped {appliance_type} repair guides")
         
     except Exception as e:
         logger.error(f"Error scraping {appliance_type} repairs: {e}")
-        
-    finally:
-        if driver:
-            driver.quit()
     
     return repair_info
 
 
-def _extract_repair_intro(page_text: str, appliance_type: str) -> Dict[str, Any]:
+@functools.lru_cache(maxsize=32)
+def _repair_intro_pattern(appliance_type: str) -> Tuple[re.Pattern, ...]:
+    """Compile the appliance-specific intro patterns once per appliance type"""
+    appliance = re.escape(appliance_type.lower().encode())
+    return compile_patterns((
+        rb'<div class="appliance-intro">([^<]*' + appliance + rb'[^<]*)</div>',
+        _GENERIC_INTRO_RE.pattern,
+        rb'Repairing a ' + appliance + rb'[^.]*\.',
+    ))
+
+def _extract_repair_intro(page_text: bytes, appliance_type: str) -> Dict[str, Any]:
     """Extract repair introduction and statistics"""
     info = {}
     
     # Extract intro text with repair statistics
-    intro_patterns = [
-        rf'<div class="appliance-intro">([^<]*{appliance_type.lower()}[^<]*)</div>',
-        r'<div class="appliance-intro">([^<]+)</div>',
-        rf'Repairing a {appliance_type.lower()}[^.]*\.'
-    ]
-    intro_text = extract_with_patterns(page_text, intro_patterns) or ''
+    intro_text = _decode(extract_first_match(page_text, _repair_intro_pattern(appliance_type))) or ''
     info['intro_text'] = intro_text.strip()
     
     # Extract repair statistics from intro text
     stats = {}
     if intro_text:
         # Extract percentage of easy repairs
-        easy_match = re.search(r'(\d+)%.*?"Easy"', intro_text)
+        easy_match = _EASY_PERCENT_RE.search(intro_text)
         if easy_match:
             stats['easy_repairs_percentage'] = int(easy_match.group(1))
         
         # Extract average time
-        time_match = re.search(r'less than (\d+) minutes?', intro_text, re.IGNORECASE)
+        time_match = _LESS_THAN_MINUTES_RE.search(intro_text)
         if time_match:
             stats['average_repair_time'] = f"Less than {time_match.group(1)} minutes"
     
@@ -505,44 +899,45 @@ def _extract_repair_intro(page_text: str, appliance_type: str) -> Dict[str, Any]
     return info
 
 
-def _extract_repair_symptoms(page_text: str, appliance_type: str) -> list:
+def _extract_repair_symptoms(tree: HTMLParser, appliance_type: str) -> list:
     """Extract common repair symptoms with descriptions and statistics"""
     symptoms = []
+    href_prefix = f"/repair/{appliance_type.lower()}/"
     
     try:
-        # Find all symptom links with their data - using a more flexible approach
-        # First find all symptom links
-        link_pattern = rf'<a href="/Repair/{appliance_type}/([^/]+)/" class="row[^"]*">(.*?)</a>'
-        link_matches = re.findall(link_pattern, page_text, re.DOTALL | re.IGNORECASE)
-        
-        matches = []
-        for url_slug, content in link_matches:
+        # Symptom cards are <a class="row ..." href="/Repair/{appliance_type}/{slug}/">
+        for link in tree.css('a.row[href]'):
+            href = link.attributes.get('href') or ''
+            if not href.lower().startswith(href_prefix):
+                continue
+            url_slug = href[len(href_prefix):].strip('/')
+            if not url_slug or '/' in url_slug:
+                continue
+            
             # Extract title
-            title_match = re.search(r'<h3 class="title-md[^"]*">([^<]+)</h3>', content)
-            title = title_match.group(1).strip() if title_match else ""
+            title_node = link.css_first('h3.title-md')
+            title = title_node.text(strip=True) if title_node else ""
             
-            # Extract description  
-            desc_match = re.search(r'<p>([^<]+)</p>', content)
-            description = desc_match.group(1).strip() if desc_match else ""
+            # Extract description
+            desc_node = link.css_first('p')
+            description = desc_node.text(strip=True) if desc_node else ""
             
-            # Extract percentage - look for the pattern we found
-            percent_match = re.search(r'<span>\s*(\d+%)\s*of\s*customers\s*</span>', content)
-            percentage = percent_match.group(1) + " of customers" if percent_match else ""
+            if not (title and description):
+                continue
             
-            if title and description:
-                matches.append((url_slug, title, description, percentage))
-        
-        for url_slug, title, description, percentage in matches:
-            # Clean up the data
-            title = title.strip()
-            description = description.strip()
-            percentage = percentage.strip()
+            # Extract percentage - "<span> 29% of customers </span>"
+            percentage = ""
+            for span in link.css('span'):
+                percent_match = _SYMPTOM_PERCENT_TEXT_RE.fullmatch(span.text(strip=True))
+                if percent_match:
+                    percentage = percent_match.group(1) + " of customers"
+                    break
             
             # Create full URL
             full_url = f"https://www.partselect.com/Repair/{appliance_type}/{url_slug}/"
             
             # Extract percentage number
-            percent_match = re.search(r'(\d+)%', percentage)
+            percent_match = _PERCENT_RE.search(percentage)
             percent_value = int(percent_match.group(1)) if percent_match else None
             
             symptom_data = {
@@ -565,41 +960,42 @@ def _extract_repair_symptoms(page_text: str, appliance_type: str) -> list:
     return symptoms
 
 
-def _extract_troubleshooting_videos(page_text: str) -> list:
+def _extract_troubleshooting_videos(tree: HTMLParser) -> list:
     """Extract troubleshooting videos from the repair page"""
     videos = []
     
     try:
-        # Find the Troubleshooting Videos section
-        video_section_pattern = r'<h2[^>]*>Troubleshooting Videos</h2>(.*?)(?=<h2|<footer|$)'
-        section_match = re.search(video_section_pattern, page_text, re.DOTALL | re.IGNORECASE)
-        
-        if section_match:
-            section_text = section_match.group(1)
+        # One document-order pass over headings, the footer and video containers:
+        # collect containers after the Troubleshooting Videos heading until the next
+        # section heading or the footer
+        in_section = False
+        for node in tree.css('h2, footer, div[data-yt-init]'):
+            if node.tag in ('h2', 'footer'):
+                if in_section:
+                    break
+                in_section = node.tag == 'h2' and node.text(strip=True).lower() == 'troubleshooting videos'
+                continue
+            if not in_section:
+                continue
             
-            # Find all video containers with YouTube data
-            video_pattern = r'<div data-yt-init="([^"]+)"[^>]*>.*?title="([^"]+)".*?alt="([^"]+)"'
-            video_matches = re.findall(video_pattern, section_text, re.DOTALL)
+            video_id = node.attributes.get('data-yt-init') or ''
+            img = node.css_first('img')
+            if not video_id or img is None:
+                continue
             
-            for video_id, title, alt_text in video_matches:
-                # Clean up the title and alt text
-                title = title.strip()
-                alt_text = alt_text.strip()
-                
-                # Create YouTube URL
-                youtube_url = f"https://www.youtube.com/watch?v={video_id}"
-                
-                # Use title if available, otherwise use alt text
-                video_title = title if title else alt_text
-                
-                video_data = {
-                    'title': video_title,
-                    'video_id': video_id,
-                    'url': youtube_url,
-                    'thumbnail_url': f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
-                }
-                
-                videos.append(video_data)
+            # Use title if available, otherwise use alt text
+            title = (img.attributes.get('title') or '').strip()
+            alt_text = (img.attributes.get('alt') or '').strip()
+            video_title = title if title else alt_text
+            if not video_title:
+                continue
+            
+            videos.append({
+                'title': video_title,
+                'video_id': video_id,
+                'url': f"https://www.youtube.com/watch?v={video_id}",
+                'thumbnail_url': f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
+            })
         
     except Exception as e:
         logging.debug(f"Error extracting troubleshooting videos: {e}")
@@ -619,6 +1015,10 @@ def scrape_symptom_detail(symptom_url: str, symptom_title: str, headless: bool =
     Returns:
         Dictionary containing detailed repair information for the symptom
     """
+    return _run(_scrape_symptom_detail(symptom_url, symptom_title, headless))
+
+async def _scrape_symptom_detail(symptom_url: str, symptom_title: str, headless: bool = True) -> Dict[str, Any]:
+    """Fetch a symptom page over HTTP and extract its repair sections"""
     logger = setup_logging()
     
     logger.info(f"Starting detailed scrape for symptom: {symptom_title} - {symptom_url}")
@@ -631,68 +1031,50 @@ def scrape_symptom_detail(symptom_url: str, symptom_title: str, headless: bool =
         'repair_stats': {}
     }
     
-    driver = None
     try:
-        # Setup driver
-        driver = setup_chrome_driver(headless)
-        
-        # Navigate to symptom page
-        driver.get(symptom_url)
-        random_delay(3, 6)
-        
-        # Simulate human behavior
-        simulate_human_behavior(driver)
-        
-        # Validate page load
-        if not validate_page_load(driver):
+        # Get the raw page bytes for regex extraction
+        page_text = await _fetch_page(symptom_url, headless)
+        if page_text is None:
             logger.error("Page validation failed")
             return symptom_detail
         
-        # Get page text for regex extraction
-        page_text = driver.page_source
-        
         # Extract repair stats
         symptom_detail['repair_stats'] = _extract_symptom_repair_stats(page_text)
         
         # Extract detailed repair sections
-        symptom_detail['repair_sections'] = _extract_repair_sections(page_text)
+        symptom_detail['repair_sections'] = _extract_repair_sections(HTMLParser(page_text))
         
         logger.info(f"Successfully scraped symptom detail for {symptom_title}")
         
     except Exception as e:
         logger.error(f"Error scraping symptom detail {symptom_title}: {e}")
-        
-    finally:
-        if driver:
-            driver.quit()
     
     return symptom_detail
 
 
-def _extract_symptom_repair_stats(page_text: str) -> Dict[str, Any]:
+def _extract_symptom_repair_stats(page_text: bytes) -> Dict[str, Any]:
     """Extract repair statistics from symptom page"""
     stats = {}
     
     try:
         # Extract repair difficulty, stories, and videos from "About this repair" section
-        about_repair_pattern = r'<h3[^>]*>About this repair:</h3>\s*<ul[^>]*>(.*?)</ul>'
-        about_match = re.search(about_repair_pattern, page_text, re.DOTALL)
+        about_match = _ABOUT_REPAIR_RE.search(page_text)
         
         if about_match:
-            about_content = about_match.group(1)
+            about_content = _decode(about_match.group(1))
             
             # Extract difficulty
-            difficulty_match = re.search(r'Rated as&nbsp;([^<]+)', about_content)
+            difficulty_match = _RATED_AS_RE.search(about_content)
             if difficulty_match:
                 stats['difficulty'] = difficulty_match.group(1).strip()
             
             # Extract number of repair stories
-            stories_match = re.search(r'(\d+)\s*repair stories', about_content)
+            stories_match = _REPAIR_STORIES_RE.search(about_content)
             if stories_match:
                 stats['repair_stories_count'] = int(stories_match.group(1))
             
             # Extract number of step by step videos
-            videos_match = re.search(r'(\d+)\s*step by step videos', about_content)
+            videos_match = _STEP_VIDEOS_RE.search(about_content)
             if videos_match:
                 stats['step_by_step_videos_count'] = int(videos_match.group(1))
         
@@ -702,56 +1084,66 @@ def _extract_symptom_repair_stats(page_text: str) -> Dict[str, Any]:
     return stats
 
 
-def _extract_repair_sections(page_text: str) -> list:
+def _section_text(node) -> str:
+    """Text of a section node with entities decoded and non-breaking spaces normalized"""
+    return node.text().replace('\xa0', ' ').strip()
+
+def _extract_repair_sections(tree: HTMLParser) -> list:
     """Extract detailed repair sections with parts and instructions"""
     sections = []
     
     try:
-        # Find all repair sections with their titles and content
-        section_pattern = r'<h2 class="section-title bold col[^"]*"[^>]*id="([^"]*)"[^>]*>([^<]+)</h2>\s*<div class="symptom-list__desc row[^"]*"[^>]*>(.*?)(?=<h2 class="section-title|<div class="back-to-top|$)'
-        section_matches = re.findall(section_pattern, page_text, re.DOTALL)
-        
-        for section_id, section_title, section_content in section_matches:
+        # Each repair section is an <h2 class="section-title"> followed by its
+        # symptom-list__desc block; walk siblings until the next section heading
+        for heading in tree.css('h2.section-title'):
+            section_id = heading.attributes.get('id')
+            if section_id is None:
+                continue
+            
+            content_nodes = []
+            node = heading.next
+            while node is not None:
+                if not node.tag.startswith('-'):  # Skip text and comment nodes
+                    classes = (node.attributes.get('class') or '').split()
+                    if (node.tag == 'h2' and 'section-title' in classes) or (node.tag == 'div' and 'back-to-top' in classes):
+                        break
+                    content_nodes.append(node)
+                node = node.next
+            
+            # The heading must be immediately followed by the description block
+            if not content_nodes or 'symptom-list__desc' not in (content_nodes[0].attributes.get('class') or '').split():
+                continue
+            
             # Clean up section title
-            section_title = section_title.replace('&amp;', '&').strip()
+            section_title = heading.text().strip()
             
             # Extract description from the first column
-            desc_pattern = r'<div class="col-lg-6">\s*<p>(.*?)</p>'
-            desc_match = re.search(desc_pattern, section_content, re.DOTALL)
             description = ""
-            if desc_match:
-                description = desc_match.group(1).strip()
-                # Clean up HTML entities and tags
-                description = re.sub(r'<[^>]+>', '', description)
-                description = description.replace('&amp;', '&').replace('&nbsp;', ' ')
+            for column in (c for n in content_nodes for c in n.css('div[class="col-lg-6"]')):
+                first_child = next(column.iter(), None)
+                if first_child is not None and first_child.tag == 'p':
+                    description = _section_text(first_child)
+                    break
             
             # Extract step-by-step instructions
             instructions = []
-            instructions_pattern = r'<ol>(.*?)</ol>'
-            instructions_match = re.search(instructions_pattern, section_content, re.DOTALL)
-            if instructions_match:
-                steps_content = instructions_match.group(1)
-                step_pattern = r'<li>(.*?)</li>'
-                steps = re.findall(step_pattern, steps_content, re.DOTALL)
-                
-                for step in steps:
-                    # Clean up HTML tags and entities
-                    step_clean = re.sub(r'<[^>]+>', '', step).strip()
-                    step_clean = step_clean.replace('&amp;', '&').replace('&nbsp;', ' ')
+            steps_list = next((ol for n in content_nodes for ol in n.css('ol')), None)
+            if steps_list is not None:
+                for step in steps_list.css('li'):
+                    step_clean = _section_text(step)
                     if step_clean:
                         instructions.append(step_clean)
             
             # Extract related parts links
             related_parts = []
-            parts_pattern = r'<a href="([^"]*)"[^>]*title="([^"]*)"[^>]*>([^<]*)</a>'
-            parts_matches = re.findall(parts_pattern, section_content)
-            
-            for part_url, part_title, part_text in parts_matches:
+            for link in (a for n in content_nodes for a in n.css('a[href][title]')):
+                part_url = link.attributes.get('href') or ''
+                part_title = link.attributes.get('title') or ''
                 if 'Dishwasher' in part_title and ('replacement' in part_title.lower() or 'OEM' in part_title):
                     related_parts.append({
                         'name': part_title.strip(),
                         'url': f"https://www.partselect.com{part_url}" if part_url.startswith('/') else part_url,
-                        'text': part_text.strip()
+                        'text': link.text().strip()
                     })
             
             section_data = {
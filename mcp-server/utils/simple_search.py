@@ -1,107 +1,481 @@
 """
 Simple fallback search system for repair data without RAG dependencies.
-Uses basic text matching when FAISS/SentenceTransformers aren't available.
+Uses a BM25F-ranked inverted index when FAISS/SentenceTransformers aren't available.
 """
 
+import copy
 import json
+import functools
+import hashlib
+import multiprocessing
+import os
+import shutil
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
 import re
 import logging
+import sys
+import threading
+
+import numpy as np
+
+from .helpers import appliance_type_for_path
+
+# numba compiles the per-term BM25F scatter-add when installed, else numpy is used
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# orjson parses the UTF-8 file bytes in Rust when installed, else the stdlib parser
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
-def simple_text_search(data_dir: str = "data", query: str = "", appliance_type: str = None, max_results: int = 8) -> Dict[str, Any]:
-    """
-    Simple text-based search through JSON repair data
-    """
-    logger.info(f"Starting search for '{query}' in appliance_type='{appliance_type}'")
+# Lowercase alphanumeric runs - used identically for indexed sections and queries
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# On-disk cache for built indexes (the text-search counterpart of .rag_index)
+INDEX_DIR = Path(".search_index")
+INDEX_VERSION = 13
+
+# BM25 saturation: k1 caps how much repeated occurrences of a term can add
+BM25_K1 = 1.2
+
+# BM25F fields, in field-id order: (weight, length normalization b). Headings
+# (symptom and section title) count double, instruction steps half
+FIELD_TITLE, FIELD_DESCRIPTION, FIELD_INSTRUCTIONS = range(3)
+BM25F_FIELDS = (
+    (2.0, 0.75),  # title
+    (1.0, 0.75),  # description
+    (0.5, 0.75),  # instructions
+)
+
+# Files per index-build worker process; smaller corpora are indexed in-process
+PARALLEL_INDEX_MIN_FILES = 64
+
+if njit is not None:
+    @njit(cache=True)
+    def _bm25f_accumulate(docs, wtf, idf, k1, scores):
+        """Add one term's BM25F contribution to scores in a single compiled loop"""
+        for i in range(docs.shape[0]):
+            f = wtf[i]
+            scores[docs[i]] += idf * f * (k1 + 1.0) / (f + k1)
+else:
+    _bm25f_accumulate = None
+
+_EMPTY_BUCKET = np.empty(0, dtype=np.int32)
+
+# Built indexes by resolved data directory; the lock stops concurrent first
+# searches from each building (and writing) the same index
+_indexes: Dict[str, "SearchIndex"] = {}
+_indexes_lock = threading.Lock()
+
+
+class RepairSection(NamedTuple):
+    """One searchable repair section (a plain tuple - no per-record dict)"""
+    appliance_type: str
+    symptom_title: str
+    title: str
+    description: str
+    instructions: List[str]
+    related_parts: List[Dict[str, Any]]
+    source_file: str
+    url: str
+
+
+class SearchIndex:
+    """Inverted index over repair sections in flat arrays, saved with np.save and memory-mapped on load"""
     
-    data_path = Path(data_dir)
-    if not data_path.exists():
-        error_msg = f"Data directory not found: {data_path.absolute()}"
-        logger.error(error_msg)
-        return {"error": error_msg}
+    # Arrays stored as <name>.npy in the index directory and memory-mapped on load.
+    # Term t's postings are the [term_offsets[t], term_offsets[t + 1]) slice of
+    # postings_docs (ascending section indices) and postings_wtf (BM25F pseudo-frequencies)
+    ARRAYS = ("postings_docs", "postings_wtf", "term_offsets")
     
-    results = []
-    query_words = query.lower().split()
+    def __init__(self, signature: str, sections: List[RepairSection], vocab: List[str], postings_docs: np.ndarray, postings_wtf: np.ndarray, term_offsets: np.ndarray):
+        self.signature = signature
+        self.sections = sections
+        self.num_docs = len(sections)
+        self.vocab = vocab
+        self.postings_docs = postings_docs
+        self.postings_wtf = postings_wtf
+        self.term_offsets = term_offsets
+        
+        # Interned so lookups with interned query tokens can short-circuit on identity
+        self.term_ids = {sys.intern(term): term_id for term_id, term in enumerate(vocab)}
+        self.idf = _bm25_idf(np.diff(term_offsets), self.num_docs)
+        
+        # Section indices bucketed by lowercased appliance type, for the appliance filter
+        buckets: Dict[str, List[int]] = {}
+        for section_idx, section in enumerate(sections):
+            buckets.setdefault(section.appliance_type.lower(), []).append(section_idx)
+        self.by_appliance = {ap: np.array(idx, dtype=np.int32) for ap, idx in buckets.items()}
     
-    logger.info(f"Searching in {data_path.absolute()}")
+    @classmethod
+    def from_tokens(cls, signature: str, sections: List[RepairSection], vocab: List[str], tok_ids: np.ndarray, tok_fields: np.ndarray, tok_offsets: np.ndarray) -> "SearchIndex":
+        """Derive the BM25F postings from the sections' concatenated token ids and fields"""
+        num_docs = len(sections)
+        num_fields = len(BM25F_FIELDS)
+        stride = max(num_docs, 1)
+        doc_of_token = np.repeat(np.arange(num_docs, dtype=np.int64), np.diff(tok_offsets))
+        
+        # Count each distinct (term, section, field) triple in one pass: sorting the
+        # combined key groups triples by term, then section, then field
+        triples, field_tf = np.unique((tok_ids.astype(np.int64) * stride + doc_of_token) * num_fields + tok_fields, return_counts=True)
+        triple_fields = triples % num_fields
+        triple_docs = (triples // num_fields) % stride
+        
+        # BM25F pseudo-frequency: each field's tf, length-normalized against that
+        # field's average length and weighted, summed per (term, section)
+        field_len = np.bincount(doc_of_token * num_fields + tok_fields, minlength=num_docs * num_fields).reshape(num_docs, num_fields)
+        avg_field_len = field_len.mean(axis=0) if num_docs else np.zeros(num_fields)
+        weights = np.array([weight for weight, _ in BM25F_FIELDS])
+        field_b = np.array([b for _, b in BM25F_FIELDS])
+        rel_len = np.divide(field_len, avg_field_len, out=np.ones(field_len.shape), where=avg_field_len > 0)
+        field_norm = (1.0 - field_b) + field_b * rel_len
+        weighted = weights[triple_fields] * field_tf / field_norm[triple_docs, triple_fields]
+        
+        pairs, pair_of_triple = np.unique(triples // num_fields, return_inverse=True)
+        wtf = np.bincount(pair_of_triple, weights=weighted, minlength=len(pairs))
+        pair_docs = (pairs % stride).astype(np.int32)
+        df = np.bincount(pairs // stride, minlength=len(vocab))
+        
+        return cls(
+            signature, sections, vocab,
+            postings_docs=pair_docs,
+            postings_wtf=wtf.astype(np.float32),
+            term_offsets=np.concatenate(([0], np.cumsum(df))).astype(np.int32)
+        )
     
-    # Find all JSON files
-    json_files = list(data_path.rglob("*.json"))
-    repair_files = [f for f in json_files if f.name != "scraped_parts.json"]
+    def posting(self, term: str) -> Optional[Tuple[np.ndarray, np.ndarray, float]]:
+        """Section indices, BM25F pseudo-frequencies and idf for term, or None if it isn't indexed"""
+        term_id = self.term_ids.get(term)
+        if term_id is None:
+            return None
+        start, end = self.term_offsets[term_id], self.term_offsets[term_id + 1]
+        return self.postings_docs[start:end], self.postings_wtf[start:end], float(self.idf[term_id])
     
-    logger.info(f"Found {len(repair_files)} repair files to search")
+    def save(self, directory: Path):
+        """Write the index to a new directory, filled under a temporary name and renamed into place"""
+        tmp_dir = directory.with_name(f"{directory.name}.{os.getpid()}.tmp")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+        try:
+            for name in self.ARRAYS:
+                np.save(tmp_dir / f"{name}.npy", getattr(self, name))
+            (tmp_dir / "vocab.json").write_text(json.dumps(self.vocab))
+            (tmp_dir / "sections.json").write_text(json.dumps([list(section) for section in self.sections]))
+            (tmp_dir / "meta.json").write_text(json.dumps({"version": INDEX_VERSION, "signature": self.signature}))
+            try:
+                tmp_dir.rename(directory)
+            except OSError:
+                # Another process saved the same build first; keep that one
+                if not (directory / "meta.json").exists():
+                    raise
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
     
-    for json_file in repair_files:
-        # Skip if appliance type filter doesn't match
-        if appliance_type:
-            file_path_str = str(json_file).lower()
-            if appliance_type.lower() not in file_path_str:
-                continue
+    @classmethod
+    def load(cls, directory: Path, signature: str) -> Optional["SearchIndex"]:
+        """Memory-map the index saved in directory, or None if it is missing or stale"""
+        meta_file = directory / "meta.json"
+        if not meta_file.exists():
+            return None
+        meta = _json_loads(meta_file.read_bytes())
+        if meta.get("version") != INDEX_VERSION or meta.get("signature") != signature:
+            return None
         
-        logger.debug(f"Processing {json_file.name}")
+        # The OS pages the arrays in on first touch, shared with any other process
+        # that maps the same index
+        arrays = {name: np.load(directory / f"{name}.npy", mmap_mode="r") for name in cls.ARRAYS}
+        sections = [RepairSection(*row) for row in _json_loads((directory / "sections.json").read_bytes())]
+        vocab = _json_loads((directory / "vocab.json").read_bytes())
+        return cls(signature, sections, vocab, **arrays)
+
+
+def _bm25_idf(df: np.ndarray, num_docs: int) -> np.ndarray:
+    """BM25 idf of terms found in df of num_docs sections (the +1 keeps it positive)"""
+    return np.log(1 + (num_docs - df + 0.5) / (df + 0.5))
+
+def _repair_files(data_path: Path) -> List[Path]:
+    """All repair JSON files under the data directory"""
+    return [f for f in data_path.rglob("*.json") if f.name != "scraped_parts.json"]
+
+def _data_signature(files: List[Path]) -> str:
+    """Fingerprint of the data files (path, size, mtime) used to detect a stale index"""
+    hasher = hashlib.sha256()
+    for f in sorted(files):
+        stat = f.stat()
+        hasher.update(f"{f}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return hasher.hexdigest()
+
+def _index_shard(repair_files: List[Path], data_dir: str) -> Tuple[List[RepairSection], List[str], array, array, array]:
+    """Tokenize repair files into sections, a shard-local vocabulary, token ids, fields and counts"""
+    data_path = Path(data_dir)
+    sections = []
+    vocab: Dict[str, int] = {}
+    tok_ids = array('i')
+    tok_fields = array('B')
+    tok_counts = array('i')
+    
+    for json_file in repair_files:
+        logger.debug("Indexing %s", json_file.name)
         
         try:
-            data = json.loads(json_file.read_text(encoding='utf-8'))
-            
-            # Extract appliance type from path
-            file_appliance_type = "General"
-            if "refrigerator" in str(json_file).lower():
-                file_appliance_type = "Refrigerator"
-            elif "dishwasher" in str(json_file).lower():
-                file_appliance_type = "Dishwasher"
-            elif "washer" in str(json_file).lower():
-                file_appliance_type = "Washer"
-            elif "dryer" in str(json_file).lower():
-                file_appliance_type = "Dryer"
+            data = _json_loads(json_file.read_bytes())
+        except Exception as e:
+            logger.error("Error processing %s: %s", json_file.name, e)
+            continue
+        
+        # Resolve the appliance type once per file, from its path under data_dir
+        file_appliance_type = appliance_type_for_path(json_file, data_path)
+        
+        symptom_title = data.get("symptom_title", "")
+        
+        # Index each repair section as one document
+        for section in data.get("repair_sections", []):
+            title = section.get("title", "")
+            description = section.get("description", "")
+            instructions = section.get("instructions", [])
             
-            symptom_title = data.get("symptom_title", "")
+            # Tokens never span a space, so tokenizing each field separately gives
+            # the same stream as tokenizing the joined text
+            fields = (
+                _TOKEN_RE.findall(f"{symptom_title} {title}".lower()),
+                _TOKEN_RE.findall(description.lower()),
+                _TOKEN_RE.findall(" ".join(instructions).lower()),
+            )
+            for field_id, tokens in enumerate(fields):
+                tok_ids.extend(vocab.setdefault(token, len(vocab)) for token in tokens)
+                tok_fields.extend([field_id] * len(tokens))
+            tok_counts.append(sum(len(tokens) for tokens in fields))
             
-            # Process repair sections
-            for section in data.get("repair_sections", []):
-                title = section.get("title", "")
-                description = section.get("description", "")
-                instructions = section.get("instructions", [])
-                
-                # Create searchable text
-                searchable_text = f"{symptom_title} {title} {description} {' '.join(instructions)}".lower()
-                
-                # Simple text matching - count query word matches
-                matches = sum(1 for word in query_words if word in searchable_text)
-                
-                if matches > 0:  # At least one query word matches
-                    score = matches / len(query_words)  # Simple relevance score
-                    
-                    results.append({
-                        "score": score,
-                        "appliance_type": file_appliance_type,
-                        "symptom": symptom_title,
-                        "issue_title": title,
-                        "text": f"Symptom: {symptom_title}\nIssue: {title}\nDescription: {description}",
-                        "instructions": instructions,
-                        "related_parts": section.get("related_parts", []),
-                        "source_file": json_file.name,
-                        "url": data.get("url", "")
-                    })
+            sections.append(RepairSection(
+                appliance_type=file_appliance_type,
+                symptom_title=symptom_title,
+                title=title,
+                description=description,
+                instructions=instructions,
+                related_parts=section.get("related_parts", []),
+                source_file=json_file.name,
+                url=data.get("url", "")
+            ))
+    
+    return sections, list(vocab), tok_ids, tok_fields, tok_counts
+
+def _index_shards(repair_files: List[Path], data_dir: str) -> List[Tuple[List[RepairSection], List[str], array, array, array]]:
+    """Tokenize the repair files across a process pool for large corpora, shards in file order"""
+    workers = min(os.cpu_count() or 1, len(repair_files) // PARALLEL_INDEX_MIN_FILES)
+    if workers > 1:
+        shard_size = -(-len(repair_files) // workers)
+        shards = [repair_files[i:i + shard_size] for i in range(0, len(repair_files), shard_size)]
+        try:
+            # spawn, not fork: the server process runs other threads
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+                return list(executor.map(_index_shard, shards, [data_dir] * len(shards)))
+        except (OSError, BrokenProcessPool) as e:
+            logger.warning("Parallel indexing failed, indexing serially: %s", e)
+    return [_index_shard(repair_files, data_dir)]
+
+def build_index(data_dir: str = "data", files: Optional[List[Path]] = None) -> SearchIndex:
+    """
+    Build the inverted index over every repair section in data_dir
+    
+    Args:
+        data_dir: Directory holding the scraped repair JSON files
+        files: Repair files to index (defaults to every JSON file under data_dir)
+    
+    Returns:
+        SearchIndex with postings and section metadata
+    """
+    data_path = Path(data_dir)
+    repair_files = files if files is not None else _repair_files(data_path)
+    
+    logger.info("Building search index from %s repair files", len(repair_files))
+    
+    # Merge the shards, remapping each shard-local vocabulary onto the global one
+    sections = []
+    vocab: Dict[str, int] = {}
+    tok_ids = []
+    tok_fields = []
+    tok_counts = []
+    for shard_sections, shard_vocab, shard_ids, shard_fields, shard_counts in _index_shards(repair_files, data_dir):
+        remap = np.array([vocab.setdefault(term, len(vocab)) for term in shard_vocab], dtype=np.int32)
+        tok_ids.append(remap[np.frombuffer(shard_ids, dtype=np.int32)] if len(shard_ids) else np.empty(0, dtype=np.int32))
+        tok_fields.append(np.frombuffer(shard_fields, dtype=np.uint8))
+        tok_counts.append(np.frombuffer(shard_counts, dtype=np.int32))
+        sections.extend(shard_sections)
+    
+    tok_ids = np.concatenate(tok_ids) if tok_ids else np.empty(0, dtype=np.int32)
+    tok_fields = np.concatenate(tok_fields) if tok_fields else np.empty(0, dtype=np.uint8)
+    tok_counts = np.concatenate(tok_counts) if tok_counts else np.empty(0, dtype=np.int32)
+    tok_offsets = np.concatenate(([0], np.cumsum(tok_counts))).astype(np.int32)
+    
+    index = SearchIndex.from_tokens(_data_signature(repair_files), sections, list(vocab), tok_ids, tok_fields, tok_offsets)
+    logger.info("Indexed %s sections, %s terms", index.num_docs, len(vocab))
+    return index
+
+def _get_index(data_path: Path) -> SearchIndex:
+    """Get the index for data_path, loading it from disk or building it on first use"""
+    key = str(data_path.resolve())
+    index = _indexes.get(key)
+    if index is not None:
+        return index
+    
+    with _indexes_lock:
+        index = _indexes.get(key)  # Another thread may have built it while we waited
+        if index is None:
+            index = _indexes[key] = _load_or_build_index(data_path, key)
+    return index
+
+def _load_or_build_index(data_path: Path, key: str) -> SearchIndex:
+    """Map the on-disk index for data_path if it is current, otherwise build and save it"""
+    index = None
+    repair_files = _repair_files(data_path)
+    signature = _data_signature(repair_files)
+    # One subdirectory per build: a rebuild never rewrites arrays that another
+    # process still has memory-mapped, it saves beside them and removes the old build
+    index_root = INDEX_DIR / hashlib.sha256(key.encode()).hexdigest()[:16]
+    index_dir = index_root / f"v{INDEX_VERSION}-{signature[:16]}"
+    
+    # Reuse the saved index if the data files haven't changed since it was built
+    try:
+        index = SearchIndex.load(index_dir, signature)
+    except Exception as e:
+        logger.warning("Could not load search index %s: %s", index_dir, e)
+    
+    if index is None:
+        index = build_index(str(data_path), repair_files)
+        _search_impl.cache_clear()  # Cached results may come from the old corpus
+        try:
+            index.save(index_dir)
+        except OSError as e:
+            logger.warning("Could not save search index %s: %s", index_dir, e)
+        else:
+            _remove_stale_indexes(index_root, index_dir)
+    
+    return index
+
+def _remove_stale_indexes(index_root: Path, current: Path):
+    """Delete every saved build in index_root except current and in-progress writes"""
+    for path in index_root.iterdir():
+        if path == current or path.name.endswith(".tmp"):
+            continue
+        if path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+def _normalize_query(query: str) -> Tuple[str, ...]:
+    """Distinct, interned query tokens in sorted order, so equivalent queries share a cache entry"""
+    return tuple(sorted({sys.intern(token) for token in _TOKEN_RE.findall(query.lower())}))
+
+def _top_sections(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest-scoring sections with a non-zero score, best first"""
+    matches = np.flatnonzero(scores)
+    if k <= 0 or not len(matches):
+        return matches[:0]
+    if len(matches) > k:
+        matches = matches[np.argpartition(-scores[matches], k - 1)[:k]]
+    return matches[np.lexsort((matches, -scores[matches]))]
+
+def _result(section: RepairSection, score: float) -> Dict[str, Any]:
+    """Result dict for one ranked section"""
+    return {
+        "score": score,
+        "appliance_type": section.appliance_type,
+        "symptom": section.symptom_title,
+        "issue_title": section.title,
+        "text": f"Symptom: {section.symptom_title}\nIssue: {section.title}\nDescription: {section.description}",
+        "instructions": section.instructions,
+        "related_parts": section.related_parts,
+        "source_file": section.source_file,
+        "url": section.url
+    }
+
+def _bm25f_scores(index: SearchIndex, query_tokens: Tuple[str, ...]) -> np.ndarray:
+    """BM25F score of every section; field weights and length normalization are folded into wtf"""
+    scores = np.zeros(index.num_docs, dtype=np.float32)
+    for term in query_tokens:
+        posting = index.posting(term)
+        if posting is None:
+            continue
         
-        except Exception as e:
-            logger.error(f"Error processing {json_file.name}: {e}")
+        docs, wtf, idf = posting
+        if _bm25f_accumulate is not None:
+            _bm25f_accumulate(np.asarray(docs), np.asarray(wtf), idf, BM25_K1, scores)
             continue
+        
+        # Section indices are unique within a posting list, so a fancy-index add
+        # is safe and avoids np.add.at's unbuffered scatter
+        scores[docs] += idf * (wtf * (BM25_K1 + 1.0)) / (wtf + BM25_K1)
+    return scores
+
+def _restrict(scores: np.ndarray, keep: np.ndarray) -> np.ndarray:
+    """Scores with every section outside keep zeroed"""
+    restricted = np.zeros_like(scores)
+    restricted[keep] = scores[keep]
+    return restricted
+
+@functools.lru_cache(maxsize=512)
+def _search_impl(data_key: str, query_tokens: Tuple[str, ...], appliance_type: Optional[str], max_results: int) -> Tuple[Dict[str, Any], ...]:
+    """Ranked results for a normalized query; memoized, so callers must copy before handing out"""
+    index = _get_index(Path(data_key))
+    scores = _bm25f_scores(index, query_tokens)
+    
+    # Keep only the requested appliance's sections
+    if appliance_type:
+        scores = _restrict(scores, index.by_appliance.get(appliance_type, _EMPTY_BUCKET))
+    
+    # Select the top max_results matching sections before building any result dicts
+    top = _top_sections(scores, max_results)
+    return tuple(_result(index.sections[section_idx], float(scores[section_idx])) for section_idx in top)
+
+def simple_text_search(data_dir: str = "data", query: str = "", appliance_type: str = None, max_results: int = 8) -> Dict[str, Any]:
+    """
+    Text search through the JSON repair data
+    
+    Args:
+        data_dir: Directory holding the scraped repair JSON files
+        query: Free-text query
+        appliance_type: Only return sections for this appliance type
+        max_results: Maximum number of results
+    """
+    logger.info("Starting search for '%s' in appliance_type='%s'", query, appliance_type)
+    
+    data_path = Path(data_dir)
+    if not data_path.exists():
+        error_msg = f"Data directory not found: {data_path.absolute()}"
+        logger.error(error_msg)
+        return {"error": error_msg}
+    
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Searching in %s", data_path.absolute())
     
-    # Sort by score (descending) and limit results
-    results.sort(key=lambda x: x["score"], reverse=True)
-    results = results[:max_results]
+    # Repeated queries are answered from the memoized ranking; deep-copy the
+    # results (instructions and related_parts are nested lists/dicts) so a caller
+    # editing them can't change what later calls get back
+    cached = _search_impl(str(data_path.resolve()), _normalize_query(query), appliance_type.lower() if appliance_type else None, max_results)
+    results = copy.deepcopy(list(cached))
     
-    logger.info(f"Found {len(results)} results")
-    if results:
-        logger.info(f"Top result: {results[0]['symptom']} - {results[0]['issue_title']} (score: {results[0]['score']:.2f})")
+    logger.info("Found %s results", len(results))
+    if results and logger.isEnabledFor(logging.INFO):
+        top = results[0]
+        logger.info("Top result: %s - %s (score: %.2f)", top['symptom'], top['issue_title'], top['score'])
     
     return {
         "query": query,
         "appliance_type": appliance_type,
         "results": results,
         "total_found": len(results),
-        "method": "Simple text search (fallback)"
+        "method": "BM25F text search (fallback)"
     }